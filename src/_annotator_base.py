@@ -1,12 +1,18 @@
 import os
+from functools import lru_cache
 
 SRC = os.path.dirname(os.path.abspath(__file__))
 
+@lru_cache(maxsize=None)
+def _p(name):
+    return os.path.join(SRC, name)
+
 def write_file(name, content):
-    path = os.path.join(SRC, name)
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    sz = os.path.getsize(path)
+    path = _p(name)
+    data = content.encode('utf-8')
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(data)
+    sz = len(data)
     print(f'Written {name}: {sz} bytes')
 
 print('Annotator ready')
@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 import os
+from functools import lru_cache
 
 SRC = os.path.dirname(os.path.abspath(__file__))
 
+@lru_cache(maxsize=None)
+def _p(name):
+    return os.path.join(SRC, name)
+
 def w(name, content):
-    path = os.path.join(SRC, name)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"Written {name}: {os.path.getsize(path)} bytes")
+    path = _p(name)
+    data = content.encode("utf-8")
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(data)
+    print(f"Written {name}: {len(data)} bytes")
 
@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 import os
 import sys
+from functools import lru_cache
 
 BASE = sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(os.path.abspath(__file__))
 
+@lru_cache(maxsize=None)
+def _p(name):
+    return os.path.join(BASE, name)
+
 def write_file(filename, content):
-    path = os.path.join(BASE, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"Written {filename}: {len(content)} chars")
+    path = _p(filename)
+    data = content.encode("utf-8")
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(data)
+    print(f"Written {filename}: {len(data)} bytes")
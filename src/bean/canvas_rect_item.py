@@ -41,6 +41,12 @@ class CanvasRectItem:
         nameId (int): 名稱標籤在 Canvas 上的繪圖物件 ID
     """
 
+    # 欄位名稱（依序列化順序），同時作為 __slots__ 以省去每個實例的 __dict__
+    _FIELDS = ("x1", "y1", "x2", "y2", "cx", "cy", "max_temp", "name", "rectId", "nameId")
+    __slots__ = _FIELDS
+    # 供 get_value 快速判斷欄位名稱是否合法
+    _FIELD_SET = frozenset(_FIELDS)
+
     def __init__(self, x1, y1, x2, y2, cx, cy, max_temp, name, rectId = 0, nameId = 0):
         """初始化矩形項目。
 
@@ -90,11 +96,7 @@ class CanvasRectItem:
 
     def to_dict(self):
         """將類別實例轉換為字典，用於 JSON 序列化儲存。"""
-        return {
-            "x1": self.x1, "y1": self.y1, "x2": self.x2, "y2": self.y2,
-            "cx": self.cx, "cy": self.cy, "max_temp": self.max_temp,
-            "name": self.name, "rectId": self.rectId, "nameId": self.nameId
-        }
+        return {key: getattr(self, key) for key in self._FIELDS}
     
     def get_value(self, key):
         """透過屬性名稱動態取得對應的值。
@@ -103,19 +105,18 @@ class CanvasRectItem:
             key (str): 屬性名稱（如 "x1", "name", "max_temp" 等）
 
         Returns:
-            屬性值，若屬性不存在則回傳 None。
+            屬性值，若不是資料欄位則回傳 None。
         """
-        if hasattr(self, key):
-            return getattr(self, key)
-        else:
-            return None
+        return getattr(self, key, None) if key in self._FIELD_SET else None
 
-# 示例：创建一个 RectItem 实例
-rect_item = CanvasRectItem(x1=0, y1=0, x2=10, y2=10, cx=5, cy=5, max_temp=100, name="Rect1", rectId=1, nameId=101)
+# 使用範例（僅在直接執行本檔案時執行，避免匯入時建立示例實例並輸出到 stdout）
+if __name__ == "__main__":
+    # 示例：创建一个 RectItem 实例
+    rect_item = CanvasRectItem(x1=0, y1=0, x2=10, y2=10, cx=5, cy=5, max_temp=100, name="Rect1", rectId=1, nameId=101)
 
-# 打印 RectItem 实例
-print(rect_item)
+    # 打印 RectItem 实例
+    print(rect_item)
 
-# 转换为字典
-rect_dict = rect_item.to_dict()
-print(rect_dict)
+    # 转换为字典
+    rect_dict = rect_item.to_dict()
+    print(rect_dict)
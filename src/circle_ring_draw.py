@@ -3,8 +3,8 @@
 # 用途：圓形標記繪製模組
 # 說明：在圖像上繪製帶編號的圓形標記點（外白色圓環 + 內紅/綠色圓 + 白色編號文字），
 #       用於標記熱力圖與 Layout 圖之間的對齊點。
-#       使用「先放大再縮小」的技巧（scale_factor 參數）提高繪製精度，
-#       避免在小半徑圓形上出現鍮齒或失真的問題。
+#       使用 cv2.circle 的子像素 shift 參數直接在原始解析度上繪製反鋸齒圓形，
+#       避免在小半徑圓形上出現鍮齒或失真的問題，且不需建立放大的中間圖像。
 #
 # 在整個應用中的角色：
 #       當使用者在熱力圖或 Layout 圖上手動標記對齊點時，本模組負責將這些對齊點
@@ -16,68 +16,117 @@
 #       - 主程式（GUI）會呼叫本模組的函式來更新圖像顯示
 # =============================================================================
 
+from functools import lru_cache
+
 import cv2
 import numpy as np
 
-def draw_circle_ring_text(imageA_np, point, index = "", radius_red = 8, ring_width = 2, scale_factor=8):
-    """
-    在指定圖像上繪製圓形標記（外白環 + 內圓 + 可選編號文字）。
+# ===== 子像素繪製參數 =====
+# cv2.circle 的 shift 參數：座標與半徑以 (1 << DRAW_SHIFT) 為單位的定點數表示，
+# 直接在原始解析度上取得子像素精度的反鋸齒圓形，取代舊版「放大 → 繪製 → 縮小」的做法。
+DRAW_SHIFT = 4
+_SHIFT_SCALE = 1 << DRAW_SHIFT
 
-    繪製流程：
-    1. 將圖像放大 scale_factor 倍以提高繪製精度
-    2. 在放大後的圖像上繪製白色外圓環與內圓
-    3. 若有編號，則在圓心處繪製白色編號文字
-    4. 將圖像縮小回原始尺寸
+# ===== 編號文字參數（以舊版 8 倍放大圖上的參數為基準） =====
+# 舊版在放大 scale_factor 倍的圖上以字型大小 3.5、粗細 10 繪製文字，
+# 縮小回原尺寸後的視覺大小等同於原始解析度上的 3.5 / scale_factor。
+_TEXT_FONT = cv2.FONT_HERSHEY_COMPLEX
+_TEXT_SCALE = 3.5
+_TEXT_THICKNESS = 10
 
-    參數：
-        imageA_np (numpy.ndarray): 輸入圖像（BGR 格式的 numpy 陣列）。
-        point (tuple): 圓心位置，格式為 (x, y)。
-        index (str): 要顯示的編號文字，預設為空字串。
-        radius_red (int): 內圓半徑，預設為 8。
-        ring_width (int): 外圓環寬度，預設為 2。
-        scale_factor (int): 縮放係數，預設為 8。
+COLOR_WHITE = (255, 255, 255)
+COLOR_RED = (0, 0, 255)
+COLOR_GREEN = (0, 255, 0)
 
-    回傳：
-        numpy.ndarray: 繪製完成後的圖像。
-    """
-    # 取得原圖尺寸
-    original_height, original_width = imageA_np.shape[:2]
 
-    # 將圖像放大以提高圓形繪製精度（避免小圓鍮齒問題）
-    imageA_np_resized = cv2.resize(imageA_np, (original_width * scale_factor, original_height * scale_factor))
+def _to_fixed(value):
+    """將浮點座標／半徑轉換為 cv2 shift 定點數表示。"""
+    return int(round(value * _SHIFT_SCALE))
 
-    # 將圓心座標與半徑同步放大，以匹配放大後的圖像尺寸
-    point_resized = (int(point[0] * scale_factor), int(point[1] * scale_factor))
-    radius_red_resized = int(radius_red * scale_factor)
-    ring_width_resized = int(ring_width * scale_factor)
+
+def _draw_ring(image_np, point, radius_red, ring_width, inner_color):
+    """在原始解析度上直接繪製一個圓形標記（外白環 + 內圓），就地修改 image_np。"""
+    center = (_to_fixed(point[0]), _to_fixed(point[1]))
 
     # 繪製外圓（白色實心圓環）
-    cv2.circle(imageA_np_resized, point_resized, radius_red_resized + ring_width_resized, (255, 255, 255), thickness=-1)
+    cv2.circle(image_np, center, _to_fixed(radius_red + ring_width), COLOR_WHITE,
+               thickness=-1, lineType=cv2.LINE_AA, shift=DRAW_SHIFT)
 
-    # 繪製內圓（紅色實心圓）
-    cv2.circle(imageA_np_resized, point_resized, radius_red_resized, (0, 0, 255), thickness=-1)
+    # 繪製內圓（紅色／綠色實心圓）
+    cv2.circle(image_np, center, _to_fixed(radius_red), inner_color,
+               thickness=-1, lineType=cv2.LINE_AA, shift=DRAW_SHIFT)
 
-    if index:
-        # cv2.putText(imageA_np_resized, "2", (point_resized[0] - scale_factor * 4 + 2, point_resized[1] + scale_factor * 3 + 2),cv2.FONT_HERSHEY_COMPLEX, 4, (255, 255, 255), 8, cv2.LINE_AA)
-        cv2.putText(imageA_np_resized, str(index), (point_resized[0] - scale_factor * 4, point_resized[1] + scale_factor * 4), cv2.FONT_HERSHEY_COMPLEX, 3.5, (255, 255, 255), 10, cv2.LINE_AA)
 
-    # 將圖像縮小回原始尺寸
-    imageA_np_resized = cv2.resize(imageA_np_resized, (original_width, original_height))
+@lru_cache(maxsize=1024)
+def _text_metrics(text, font_scale, thickness):
+    """快取 cv2.getTextSize 的結果，回傳 (寬, 高, baseline)。"""
+    (text_w, text_h), baseline = cv2.getTextSize(text, _TEXT_FONT, font_scale, thickness)
+    return text_w, text_h, baseline
 
-    # 可選：使用高斯模糊減少鍮齒（目前已停用）
-    # imageA_np_resized = cv2.GaussianBlur(imageA_np_resized, (5, 5), 0)
 
-    return imageA_np_resized
+@lru_cache(maxsize=1024)
+def _text_sprite(text, font_scale, thickness):
+    """將編號文字預先繪製成灰階遮罩（sprite）並快取。
 
-def draw_circle_ring(imageA_np, point, radius_red = 8, ring_width = 2, scale_factor=8):
+    回傳的遮罩即為反鋸齒文字的 alpha 值（0~255），相同的編號、字型大小與粗細
+    只會繪製一次，之後每次重繪都直接貼上快取的遮罩，不再重新走訪 Hershey 字型表。
+
+    回傳：
+        tuple: (mask, offset_x, offset_y)，offset 為遮罩左上角相對於文字基準點的位移。
+    """
+    text_w, text_h, baseline = _text_metrics(text, font_scale, thickness)
+    pad = thickness + 1
+    mask = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad), dtype=np.uint8)
+    cv2.putText(mask, text, (pad, text_h + pad), _TEXT_FONT, font_scale, 255, thickness, cv2.LINE_AA)
+    mask.setflags(write=False)
+    return mask, -pad, -(text_h + pad)
+
+
+def _blit_white(image_np, mask, x0, y0):
+    """以 mask 作為 alpha，將白色貼到 image_np 的 (x0, y0) 位置（超出圖像的部分自動裁切）。"""
+    img_h, img_w = image_np.shape[:2]
+    mask_h, mask_w = mask.shape
+    ix0, iy0 = max(x0, 0), max(y0, 0)
+    ix1, iy1 = min(x0 + mask_w, img_w), min(y0 + mask_h, img_h)
+    if ix0 >= ix1 or iy0 >= iy1:
+        return
+
+    alpha = mask[iy0 - y0:iy1 - y0, ix0 - x0:ix1 - x0].astype(np.uint16)
+    if image_np.ndim == 3:
+        alpha = alpha[:, :, None]
+    roi = image_np[iy0:iy1, ix0:ix1]
+    # 與 cv2.putText(LINE_AA) 相同的混色方式：dst = src * (1 - a) + 255 * a
+    roi[...] = (roi * (255 - alpha) + 255 * alpha + 127) // 255
+
+
+def _text_params(scale_factor):
+    """依舊版放大係數換算原始解析度上的 (字型大小, 粗細)，每次繪製只需計算一次。"""
+    return _TEXT_SCALE / scale_factor, max(1, round(_TEXT_THICKNESS / scale_factor))
+
+
+def _draw_index(image_np, point, index, font_scale, thickness):
+    """在圓心處繪製置中的白色編號文字，就地修改 image_np。
+
+    文字大小由 _text_params 換算自舊版放大圖上的參數，維持與舊版相同的視覺效果；
+    位置依快取的文字尺寸置中，多位數編號也能正確對齊圓心。
+    文字本身以快取的 sprite 貼上（見 _text_sprite）。
+    """
+    text = str(index)
+    text_w, text_h, _ = _text_metrics(text, font_scale, thickness)
+    mask, offset_x, offset_y = _text_sprite(text, font_scale, thickness)
+    org_x = int(round(point[0] - text_w / 2))
+    org_y = int(round(point[1] + text_h / 2))
+    _blit_white(image_np, mask, org_x + offset_x, org_y + offset_y)
+
+
+def draw_circle_ring_text(imageA_np, point, index = "", radius_red = 8, ring_width = 2, scale_factor=8):
     """
     在指定圖像上繪製圓形標記（外白環 + 內圓 + 可選編號文字）。
 
     繪製流程：
-    1. 將圖像放大 scale_factor 倍以提高繪製精度
-    2. 在放大後的圖像上繪製白色外圓環與內圓
+    1. 複製輸入圖像（不修改呼叫端的陣列）
+    2. 以 cv2.circle 的子像素 shift 參數直接在原始解析度上繪製反鋸齒的白色外圓環與內圓
     3. 若有編號，則在圓心處繪製白色編號文字
-    4. 將圖像縮小回原始尺寸
 
     參數：
         imageA_np (numpy.ndarray): 輸入圖像（BGR 格式的 numpy 陣列）。
@@ -85,189 +134,95 @@ def draw_circle_ring(imageA_np, point, radius_red = 8, ring_width = 2, scale_fac
         index (str): 要顯示的編號文字，預設為空字串。
         radius_red (int): 內圓半徑，預設為 8。
         ring_width (int): 外圓環寬度，預設為 2。
-        scale_factor (int): 縮放係數，預設為 8。
+        scale_factor (int): 舊版放大係數，預設為 8；目前僅用於換算編號文字大小。
 
     回傳：
         numpy.ndarray: 繪製完成後的圖像。
     """
-    # 取得原圖尺寸
-    original_height, original_width = imageA_np.shape[:2]
-
-    # 將圖像放大以提高圓形繪製精度（避免小圓鍮齒問題）
-    imageA_np_resized = cv2.resize(imageA_np, (original_width * scale_factor, original_height * scale_factor))
-
-    # 將圓心座標與半徑同步放大，以匹配放大後的圖像尺寸
-    point_resized = (int(point[0] * scale_factor), int(point[1] * scale_factor))
-    radius_red_resized = int(radius_red * scale_factor)
-    ring_width_resized = int(ring_width * scale_factor)
-
-    # 繪製外圓（白色實心圓環）
-    cv2.circle(imageA_np_resized, point_resized, radius_red_resized + ring_width_resized, (255, 255, 255), thickness=-1)
-
-    # 繪製內圓（紅色實心圓）
-    cv2.circle(imageA_np_resized, point_resized, radius_red_resized, (0, 255, 0), thickness=-1)
-
-    # 將圖像縮小回原始尺寸
-    imageA_np_resized = cv2.resize(imageA_np_resized, (original_width, original_height))
-
-    # 可選：使用高斯模糊減少鍮齒（目前已停用）
-    # imageA_np_resized = cv2.GaussianBlur(imageA_np_resized, (5, 5), 0)
-
-    return imageA_np_resized
-
+    image_np = imageA_np.copy()
+    _draw_ring(image_np, point, radius_red, ring_width, COLOR_RED)
+    if index:
+        _draw_index(image_np, point, index, *_text_params(scale_factor))
+    return image_np
 
-def draw_points_circle_ring_text(imageA_np, points, radius_red = 8, ring_width = 2, scale_factor=8):
+def draw_circle_ring(imageA_np, point, radius_red = 8, ring_width = 2, scale_factor=8):
     """
-    在指定圖像上繪製圓形標記（外白環 + 內圓 + 可選編號文字）。
-
-    繪製流程：
-    1. 將圖像放大 scale_factor 倍以提高繪製精度
-    2. 在放大後的圖像上繪製白色外圓環與內圓
-    3. 若有編號，則在圓心處繪製白色編號文字
-    4. 將圖像縮小回原始尺寸
+    在指定圖像上繪製圓形標記（外白環 + 內綠色圓）。
 
     參數：
         imageA_np (numpy.ndarray): 輸入圖像（BGR 格式的 numpy 陣列）。
         point (tuple): 圓心位置，格式為 (x, y)。
-        index (str): 要顯示的編號文字，預設為空字串。
         radius_red (int): 內圓半徑，預設為 8。
         ring_width (int): 外圓環寬度，預設為 2。
-        scale_factor (int): 縮放係數，預設為 8。
+        scale_factor (int): 舊版放大係數，保留以相容既有呼叫端。
 
     回傳：
         numpy.ndarray: 繪製完成後的圖像。
     """
-    # 取得原圖尺寸
-    original_height, original_width = imageA_np.shape[:2]
-
-    # 將圖像放大以提高圓形繪製精度（避免小圓鍮齒問題）
-    imageA_np_resized = cv2.resize(imageA_np, (original_width * scale_factor, original_height * scale_factor))
-
-    # 將圓心座標與半徑同步放大，以匹配放大後的圖像尺寸
-    radius_red_resized = int(radius_red * scale_factor)
-    ring_width_resized = int(ring_width * scale_factor)
-
-    index = 0
-    for point in points:
-        index += 1
-        point_resized = (int(point[0] * scale_factor), int(point[1] * scale_factor))
-
-        # 繪製外圓（白色實心圓環）
-        cv2.circle(imageA_np_resized, point_resized, radius_red_resized + ring_width_resized, (255, 255, 255), thickness=-1)
-
-        # 繪製內圓（紅色實心圓）
-        cv2.circle(imageA_np_resized, point_resized, radius_red_resized, (0, 0, 255), thickness=-1)
+    image_np = imageA_np.copy()
+    _draw_ring(image_np, point, radius_red, ring_width, COLOR_GREEN)
+    return image_np
 
-        if index:
-            # cv2.putText(imageA_np_resized, "2", (point_resized[0] - scale_factor * 4 + 2, point_resized[1] + scale_factor * 3 + 2),cv2.FONT_HERSHEY_COMPLEX, 4, (255, 255, 255), 8, cv2.LINE_AA)
-            cv2.putText(imageA_np_resized, str(index), (point_resized[0] - scale_factor * 4, point_resized[1] + scale_factor * 4), cv2.FONT_HERSHEY_COMPLEX, 3.5, (255, 255, 255), 10, cv2.LINE_AA)
 
-    # 將圖像縮小回原始尺寸
-    imageA_np_resized = cv2.resize(imageA_np_resized, (original_width, original_height))
+def draw_points_circle_ring_text(imageA_np, points, radius_red = 8, ring_width = 2, scale_factor=8):
+    """
+    在指定圖像上繪製多個圓形標記（外白環 + 內紅色圓 + 從 1 開始的編號文字）。
 
-    # 可選：使用高斯模糊減少鍮齒（目前已停用）
-    # imageA_np_resized = cv2.GaussianBlur(imageA_np_resized, (5, 5), 0)
+    參數：
+        imageA_np (numpy.ndarray): 輸入圖像（BGR 格式的 numpy 陣列）。
+        points (list): 圓心位置列表，每個元素格式為 (x, y)。
+        radius_red (int): 內圓半徑，預設為 8。
+        ring_width (int): 外圓環寬度，預設為 2。
+        scale_factor (int): 舊版放大係數，預設為 8；目前僅用於換算編號文字大小。
 
-    return imageA_np_resized
+    回傳：
+        numpy.ndarray: 繪製完成後的圖像。
+    """
+    image_np = imageA_np.copy()
+    font_scale, thickness = _text_params(scale_factor)
+    for index, point in enumerate(points, start=1):
+        _draw_ring(image_np, point, radius_red, ring_width, COLOR_RED)
+        _draw_index(image_np, point, index, font_scale, thickness)
+    return image_np
 
 def draw_points_circle_ring(image_np, points, radius_red = 8, ring_width = 2, scale_factor=8):
     """
-    在给定图像上绘制内外圆圈，并返回经过处理后的图像。
+    在给定图像上绘制多个内外圆圈（外白环 + 内绿色圆），并返回经过处理后的图像。
     
     参数:
     - image_np: 输入图像（numpy 数组）。
-    - point: 圆心位置 (x, y)。
+    - points: 圆心位置列表 [(x, y), ...]。
     - radius_red: 內圓半徑。
     - ring_width: 外圓環寬度。
-    - scale_factor: 缩放系数，默认为 8，用于提高绘制精度。
+    - scale_factor: 旧版放大系数，保留以兼容既有调用端。
     
     返回:
     - 处理后的图像（numpy 数组）。
     """
-
-    # 取得原圖尺寸
-    original_height, original_width = image_np.shape[:2]
-
-    # 將圖像放大以提高圓形繪製精度（避免小圓鍮齒問題）
-    image_np_resized = cv2.resize(image_np, (original_width * scale_factor, original_height * scale_factor))
-    radius_red_resized = int(radius_red * scale_factor)
-    ring_width_resized = int(ring_width * scale_factor)
-
-    index = 0
+    result_np = image_np.copy()
     for point in points:
-        index += 1
-
-        # 將圓心座標與半徑同步放大，以匹配放大後的圖像尺寸
-        point_resized = (int(point[0] * scale_factor), int(point[1] * scale_factor))
-
-        # 繪製外圓（白色實心圓環）
-        cv2.circle(image_np_resized, point_resized, radius_red_resized + ring_width_resized, (255, 255, 255), thickness=-1)
-
-        # 繪製內圓（紅色實心圓）
-        cv2.circle(image_np_resized, point_resized, radius_red_resized, (0, 255, 0), thickness=-1)
-
-    # 將圖像縮小回原始尺寸
-    image_np_resized = cv2.resize(image_np_resized, (original_width, original_height))
-
-    # 可選：使用高斯模糊減少鍮齒（目前已停用）
-    # imageA_np_resized = cv2.GaussianBlur(image_np_resized, (5, 5), 0)
-    return image_np_resized
+        _draw_ring(result_np, point, radius_red, ring_width, COLOR_GREEN)
+    return result_np
 
 
 
 def draw_points(imageA_np, points, radius_red = 8, ring_width = 2, scale_factor=8):
     """
-    在指定圖像上繪製圓形標記（外白環 + 內圓 + 可選編號文字）。
+    在指定圖像上繪製多個圓形標記（外白環 + 內紅色圓 + 從 1 開始的編號文字）。
 
-    繪製流程：
-    1. 將圖像放大 scale_factor 倍以提高繪製精度
-    2. 在放大後的圖像上繪製白色外圓環與內圓
-    3. 若有編號，則在圓心處繪製白色編號文字
-    4. 將圖像縮小回原始尺寸
+    與 draw_points_circle_ring_text 行為相同，保留以相容既有呼叫端。
 
     參數：
         imageA_np (numpy.ndarray): 輸入圖像（BGR 格式的 numpy 陣列）。
-        point (tuple): 圓心位置，格式為 (x, y)。
-        index (str): 要顯示的編號文字，預設為空字串。
+        points (list): 圓心位置列表，每個元素格式為 (x, y)。
         radius_red (int): 內圓半徑，預設為 8。
         ring_width (int): 外圓環寬度，預設為 2。
-        scale_factor (int): 縮放係數，預設為 8。
+        scale_factor (int): 舊版放大係數，預設為 8；目前僅用於換算編號文字大小。
 
     回傳：
         numpy.ndarray: 繪製完成後的圖像。
     """
-    # 取得原圖尺寸
-    original_height, original_width = imageA_np.shape[:2]
-
-    # 將圖像放大以提高圓形繪製精度（避免小圓鍮齒問題）
-    imageA_np_resized = cv2.resize(imageA_np, (original_width * scale_factor, original_height * scale_factor))
-
-    # 將圓心座標與半徑同步放大，以匹配放大後的圖像尺寸
-    radius_red_resized = int(radius_red * scale_factor)
-    ring_width_resized = int(ring_width * scale_factor)
-
-    index = 0
-    for point in points:
-        index += 1
-        point_resized = (int(point[0] * scale_factor), int(point[1] * scale_factor))
-
-        # 繪製外圓（白色實心圓環）
-        cv2.circle(imageA_np_resized, point_resized, radius_red_resized + ring_width_resized, (255, 255, 255), thickness=-1)
-
-        # 繪製內圓（紅色實心圓）
-        cv2.circle(imageA_np_resized, point_resized, radius_red_resized, (0, 0, 255), thickness=-1)
-
-        if index:
-            # cv2.putText(imageA_np_resized, "2", (point_resized[0] - scale_factor * 4 + 2, point_resized[1] + scale_factor * 3 + 2),cv2.FONT_HERSHEY_COMPLEX, 4, (255, 255, 255), 8, cv2.LINE_AA)
-            cv2.putText(imageA_np_resized, str(index), (point_resized[0] - scale_factor * 4, point_resized[1] + scale_factor * 4), cv2.FONT_HERSHEY_COMPLEX, 3.5, (255, 255, 255), 10, cv2.LINE_AA)
-
-    # 將圖像縮小回原始尺寸
-    imageA_np_resized = cv2.resize(imageA_np_resized, (original_width, original_height))
-
-    # 可選：使用高斯模糊減少鍮齒（目前已停用）
-    # imageA_np_resized = cv2.GaussianBlur(imageA_np_resized, (5, 5), 0)
-
-    return imageA_np_resized
+    return draw_points_circle_ring_text(imageA_np, points, radius_red, ring_width, scale_factor)
 
 # 使用範例
 if __name__ == "__main__":
@@ -22,6 +22,14 @@
 import numpy as np
 import cv2
 
+# Numba 為選用相依套件：安裝時以融合的 BGR→HSV 閾值核心產生遮罩，
+# 未安裝時退回 cv2.cvtColor + cv2.inRange 的兩段式做法。
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # ===== 各顏色在 HSV 色彩空間中的範圍定義 =====
 # 格式：(H_min, S_min, V_min), (H_max, S_max, V_max)
 # H: 色相 (0-180), S: 飽和度 (0-255), V: 明度 (0-255)
@@ -56,36 +64,122 @@ upper_green_2 = np.array([90, 255, 255])
 lower_green_3 = np.array([50, 150, 150])
 upper_green_3 = np.array([70, 255, 255])
 
+# ===== 合併後的綠色 HSV 範圍（供 get_mask_boundary 單次 inRange 使用） =====
+# 上述四組綠色範圍在 H、S、V 各通道上都被深綠色範圍（lower_green_2 ~ upper_green_2）
+# 完整涵蓋，因此四組遮罩的聯集即等於其外包範圍，只需一次 cv2.inRange 即可取得。
+# 各綠色子範圍於匯入時一次打包為連續的 (K, 3) uint8 陣列，之後不再逐次重建。
+GREEN_LOWERS = np.ascontiguousarray(
+    np.stack((lower_green, lower_green_1, lower_green_2, lower_green_3)), dtype=np.uint8)
+GREEN_UPPERS = np.ascontiguousarray(
+    np.stack((upper_green, upper_green_1, upper_green_2, upper_green_3)), dtype=np.uint8)
+lower_green_merged = GREEN_LOWERS.min(axis=0)
+upper_green_merged = GREEN_UPPERS.max(axis=0)
+# cv2.inRange 直接接受 Python tuple 作為 Scalar，避免每次呼叫轉換 ndarray
+_lower_green_bound = tuple(int(v) for v in lower_green_merged)
+_upper_green_bound = tuple(int(v) for v in upper_green_merged)
+
+# ===== OpenCV 8-bit BGR→HSV 定點除法查表（與 cv2.COLOR_BGR2HSV 結果逐像素一致） =====
+_HSV_SHIFT = 12
+_HSV_ROUND = 1 << (_HSV_SHIFT - 1)
+_divisors = np.arange(1, 256, dtype=np.float64)
+_sdiv_table = np.zeros(256, dtype=np.int32)
+_sdiv_table[1:] = np.round((255 << _HSV_SHIFT) / _divisors)
+_hdiv_table = np.zeros(256, dtype=np.int32)
+_hdiv_table[1:] = np.round((180 << _HSV_SHIFT) / (6.0 * _divisors))
+_lower_green_i32 = lower_green_merged.astype(np.int32)
+_upper_green_i32 = upper_green_merged.astype(np.int32)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _bgr_range_mask_kernel(bgr, lower, upper, sdiv_table, hdiv_table):
+        """單次掃描 BGR 影像，逐像素計算 HSV 並判斷是否落在 [lower, upper] 範圍內。
+
+        不建立中間的 HSV 影像，僅寫出一張 0/255 的遮罩。
+        """
+        rows, cols = bgr.shape[0], bgr.shape[1]
+        mask = np.zeros((rows, cols), dtype=np.uint8)
+        for y in prange(rows):
+            for x in range(cols):
+                b = np.int32(bgr[y, x, 0])
+                g = np.int32(bgr[y, x, 1])
+                r = np.int32(bgr[y, x, 2])
+
+                v = max(b, g, r)
+                if v < lower[2] or v > upper[2]:
+                    continue
+                diff = v - min(b, g, r)
+
+                s = (diff * sdiv_table[v] + _HSV_ROUND) >> _HSV_SHIFT
+                if s < lower[1] or s > upper[1]:
+                    continue
+
+                if diff == 0:
+                    h = 0
+                else:
+                    if v == r:
+                        h = g - b
+                    elif v == g:
+                        h = b - r + 2 * diff
+                    else:
+                        h = r - g + 4 * diff
+                    h = (h * hdiv_table[diff] + _HSV_ROUND) >> _HSV_SHIFT
+                    if h < 0:
+                        h += 180
+                if h < lower[0] or h > upper[0]:
+                    continue
+
+                mask[y, x] = 255
+        return mask
+
+
+def bgr_green_mask(bgr):
+    """以融合核心直接從 BGR 影像產生 PCB 綠色基板遮罩。
+
+    安裝 Numba 且影像為連續的 3 通道 uint8 陣列時，使用單次掃描的
+    平行核心；否則退回 cv2.cvtColor + cv2.inRange。兩者結果逐像素一致。
+
+    Args:
+        bgr (numpy.ndarray): BGR 格式的影像
+
+    Returns:
+        numpy.ndarray: 二值化遮罩影像，255=綠色基板區域，0=非基板區域
+    """
+    if (NUMBA_AVAILABLE and bgr.dtype == np.uint8
+            and bgr.ndim == 3 and bgr.shape[2] == 3):
+        return _bgr_range_mask_kernel(np.ascontiguousarray(bgr),
+                                      _lower_green_i32, _upper_green_i32,
+                                      _sdiv_table, _hdiv_table)
+
+    hsv_image = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    return cv2.inRange(hsv_image, _lower_green_bound, _upper_green_bound)
+
 
-def get_mask_boundary(imageB):
+def get_mask_boundary(imageB=None, *, hsv=None):
     """根據 HSV 色彩範圍生成 PCB 基板區域的二值化遮罩。
 
-    將輸入的 Layout 圖（imageB）轉換為 HSV 色彩空間，
-    分別建立多個綠色範圍的遮罩，最後合併為一個整體遮罩。
+    將輸入的 Layout 圖（imageB）以 HSV 色彩空間判斷，
+    以預先合併的綠色範圍（涵蓋所有綠色子範圍）建立一個整體遮罩。
+    安裝 Numba 時色彩轉換與閾值判斷在同一次掃描內完成。
+    若呼叫端已有轉換好的 HSV 影像，可透過 hsv 參數傳入以省去色彩轉換。
     遮罩中像素值為 255 表示該位置為綠色基板區域，0 表示非基板區域。
 
     Args:
         imageB (numpy.ndarray): 輸入的 Layout 圖影像（BGR 格式的 NumPy 陣列）
+        hsv (numpy.ndarray): 已轉換為 HSV 色彩空間的 Layout 圖（選填，提供時忽略 imageB）
 
     Returns:
         numpy.ndarray: 二值化遮罩影像，255=綠色基板區域，0=非基板區域
 
     Raises:
-        ValueError: 當輸入影像為 None 時拋出
+        ValueError: 當輸入影像與 HSV 影像皆為 None 時拋出
     """
+    if hsv is not None:
+        return cv2.inRange(hsv, _lower_green_bound, _upper_green_bound)
+
     if imageB is None:
         raise ValueError("輸入的影像資料為空。")
 
-    # 將 BGR 影像轉換為 HSV 色彩空間
-    hsv_image = cv2.cvtColor(imageB, cv2.COLOR_BGR2HSV)
-
-    # 分別建立各顏色範圍的遮罩
-    mask_white = cv2.inRange(hsv_image, lower_white, upper_white)      # 白色遮罩（目前未使用）
-    mask_green = cv2.inRange(hsv_image, lower_green, upper_green)      # 基本綠色遮罩
-    mask_green1 = cv2.inRange(hsv_image, lower_green_1, upper_green_1) # 淺綠色遮罩
-    mask_green2 = cv2.inRange(hsv_image, lower_green_2, upper_green_2) # 深綠色遮罩
-    mask_green3 = cv2.inRange(hsv_image, lower_green_3, upper_green_3) # 明亮綠色遮罩
-
-    # 將所有綠色遮罩做 OR 運算合併，形成完整的基板區域遮罩
-    mask_boundary = mask_green | mask_green1 | mask_green2 | mask_green3
+    # 以合併後的綠色範圍完成閾值分割（等同於四組綠色遮罩做 OR 運算）
+    mask_boundary = bgr_green_mask(imageB)
     return mask_boundary
@@ -20,8 +20,88 @@
     - temperature_config_manager.py：可能讀取相關配置
 """
 
+import copy
 import json
 import os
+from types import MappingProxyType
+
+# 優先使用 C 實作的 JSON 套件（orjson → ujson），皆未安裝時退回標準庫 json
+try:
+    import orjson as _json_fast
+    _FAST_JSON = "orjson"
+except ImportError:
+    try:
+        import ujson as _json_fast
+        _FAST_JSON = "ujson"
+    except ImportError:
+        _json_fast = json
+        _FAST_JSON = "json"
+
+# 預設配置（唯讀），於匯入時建立一次。值皆為不可變的基本型別，淺拷貝即可安全修改。
+# 當 JSON 檔案不存在、解析失敗，或舊版檔案缺少部分鍵值時，以此補齊。
+_DEFAULT_CONFIG = MappingProxyType({
+    "magnifier_switch": True,               # 放大鏡開關（預設開啟）
+    "circle_switch": False,                  # 圓形對齊點標記開關（預設關閉）
+    "last_folder_path": None,                # 上次開啟的資料夾路徑
+
+    # ===== 熱力圖標記的顏色與字型設定 =====
+    "heat_rect_color": "#BCBCBC",           # 熱力圖 - 矩形框顏色
+    "heat_name_color": "#FFFFFF",           # 熱力圖 - 元器件名稱顏色
+    "heat_name_font_size": 28,              # 熱力圖 - 元器件名稱字型大小
+    "heat_temp_color": "#FF0000",           # 熱力圖 - 最高溫度顏色
+    "heat_temp_font_size": 14,              # 熱力圖 - 最高溫度字型大小
+    "heat_rect_width": 2,                   # 熱力圖 - 矩形框線粗細 (1~5)
+    "heat_selected_color": "#4A90E2",       # 熱力圖 - 選中矩形框顏色
+    "heat_anchor_color": "#FF0000",         # 熱力圖 - 選中矩形框錨點顏色
+    "heat_anchor_radius": 4,                # 熱力圖 - 選中矩形框錨點半徑
+
+    # ===== Layout 圖標記的顏色與字型設定 =====
+    "layout_rect_color": "#BCBCBC",         # Layout 圖 - 矩形框顏色
+    "layout_name_color": "#FFFFFF",         # Layout 圖 - 元器件名稱顏色
+    "layout_name_font_size": 28,            # Layout 圖 - 元器件名稱字型大小
+    "layout_temp_color": "#FF0000",         # Layout 圖 - 最高溫度顏色
+    "layout_temp_font_size": 14,            # Layout 圖 - 最高溫度字型大小
+    "layout_rect_width": 2,                 # Layout 圖 - 矩形框線粗細 (1~5)
+})
+
+
+def _load_json_file(file_path):
+    """以可用的最快 JSON 套件讀取並解析檔案。解析失敗時拋出 ValueError 的子類別。"""
+    if _FAST_JSON == "orjson":
+        with open(file_path, mode='rb') as file:
+            return _json_fast.loads(file.read())
+    with open(file_path, mode='r', encoding='utf-8') as file:
+        return _json_fast.load(file)
+
+
+def _dump_json_file(data, file_path, pretty=False):
+    """以可用的最快 JSON 套件將 data 寫入檔案（保留非 ASCII 字元）。
+
+    預設輸出精簡格式（無縮排、無多餘空白）；pretty=True 時以縮排 2 輸出，方便人工閱讀。
+    """
+    if _FAST_JSON == "orjson":
+        option = _json_fast.OPT_NON_STR_KEYS
+        if pretty:
+            option |= _json_fast.OPT_INDENT_2
+        payload = _json_fast.dumps(data, option=option)
+        with open(file_path, mode='wb') as file:
+            file.write(payload)
+        return
+    with open(file_path, mode='w', encoding='utf-8') as file:
+        if pretty:
+            _json_fast.dump(data, file, ensure_ascii=False, indent=2)
+        elif _FAST_JSON == "ujson":
+            _json_fast.dump(data, file, ensure_ascii=False)
+        else:
+            _json_fast.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+
+
+# 已解析的 JSON 配置快取：檔案路徑 → (st_mtime_ns, st_size, 解析結果)
+# 檔案未變動時直接回傳快取內容的副本，不再重新讀檔與解析。
+_JSON_CACHE = {}
+
+# 用於區分「鍵不存在」與「值為 None」的哨兵物件
+_SENTINEL = object()
 
 
 class GlobalConfig:
@@ -35,32 +115,33 @@ class GlobalConfig:
         _instance (GlobalConfig): 單例實例（類別變數）
         _config (dict): 配置資料字典
         _initialized (bool): 是否已初始化完成的旗標
+        _dirty (bool): 配置自上次儲存後是否有變更
+        _saved_path (str): 上次儲存的檔案路徑
+        _version (int): 配置版本號，每次內容變更時遞增，供繪圖端判斷快取是否失效
     """
 
     _instance = None
 
     def __new__(cls, *args, **kwargs):
-        """實現單例模式，確保只建立一個實例。"""
+        """實現單例模式，確保只建立一個實例。
+
+        首次建立時即完成一次性的初始化（建立 config 目錄、從 JSON 檔案載入配置），
+        之後每次 GlobalConfig() 只回傳既有實例，不再重複檢查目錄或讀檔。
+        """
         if not cls._instance:
-            cls._instance = super().__new__(cls)
-            cls._instance._config = {}
+            instance = super().__new__(cls)
+            instance._config = {}
+            instance._dirty = True
+            instance._saved_path = None
+            instance._version = 0
+            os.makedirs("config", exist_ok=True)
+            instance.load_from_json()
+            instance._initialized = True
+            cls._instance = instance
         return cls._instance
 
     def __init__(self):
-        """初始化配置管理器。首次建立時從 JSON 檔案載入配置。"""
-        if not hasattr(self, '_initialized'):
-            self._initialized = True
-            if not os.path.exists("config"):
-                os.makedirs("config")
-            self.load_from_json()
-            # self._config = {
-            #     "debug": True,
-            #     "log_level": "INFO",
-            #     "theme": "light",
-            #     "max_connections": 10,
-            #     "magnifier_switch": False,
-            #     "circle_switch": False,
-            # }
+        """初始化配置管理器。一次性的初始化已在 __new__ 中完成，每次呼叫皆不需再做任何事。"""
 
     def set(self, key, value):
         """設定配置項目。
@@ -70,6 +151,13 @@ class GlobalConfig:
             value: 配置值（任意可序列化的型別）
         """
         self._config[key] = value
+        self._dirty = True
+        self._version += 1
+
+    @property
+    def version(self):
+        """配置版本號（int）。配置內容每次變更都會遞增，可作為快取鍵判斷設定是否已更新。"""
+        return self._version
 
     def get(self, key, default=None):
         """取得配置項目的值。
@@ -83,24 +171,54 @@ class GlobalConfig:
         """
         return self._config.get(key, default)
 
+    def get_many(self, keys_with_defaults):
+        """一次取得多個配置項目的值。
+
+        Args:
+            keys_with_defaults (Mapping): 配置鍵名 → 預設值
+
+        Returns:
+            dict: 配置鍵名 → 配置值（鍵不存在時為對應的預設值）
+        """
+        config = self._config
+        return {key: config.get(key, default) for key, default in keys_with_defaults.items()}
+
     def remove(self, key):
         """移除指定的配置項目。"""
         if key in self._config:
             del self._config[key]
+            self._dirty = True
+            self._version += 1
 
     def clear(self):
         """清空所有配置項目。"""
         self._config.clear()
+        self._dirty = True
+        self._version += 1
+
+    def save_to_json(self, filename='config/config.json', pretty=False):
+        """將配置字典序列化並儲存為 JSON 檔案。
+
+        配置自上次儲存到同一檔案後未曾變更時直接略過。寫入時先寫到暫存檔
+        再以 os.replace 原子性地取代原檔，避免寫到一半時中斷造成檔案損毀。
+
+        Args:
+            filename (str): JSON 配置檔案路徑（預設為 config/config.json）
+            pretty (bool): 為 True 時以縮排格式輸出，預設輸出精簡格式以加快寫入
+        """
+        if not self._dirty and filename == self._saved_path:
+            return
 
-    def save_to_json(self, filename='config/config.json'):
-        """將配置字典序列化並儲存為 JSON 檔案。"""
         # 確保配置目錄存在
         config_dir = os.path.dirname(filename)
         if config_dir and not os.path.exists(config_dir):
             os.makedirs(config_dir, exist_ok=True)
-        
-        with open(filename, mode='w', encoding='utf-8') as file:
-            json.dump(self._config, file, ensure_ascii=False, indent=2)
+
+        tmp_filename = filename + ".tmp"
+        _dump_json_file(self._config, tmp_filename, pretty)
+        os.replace(tmp_filename, filename)
+        self._dirty = False
+        self._saved_path = filename
 
     def load_from_json(self, file_path='config/config.json'):
         """從 JSON 檔案載入配置資料至 self._config。
@@ -108,12 +226,25 @@ class GlobalConfig:
         Args:
             file_path (str): JSON 配置檔案路徑（預設為 config/config.json）
         """
+        self._dirty = True
+        self._version += 1
         if os.path.exists(file_path):
             try:
-                with open(file_path, mode='r', encoding='utf-8') as file:
-                    self._config = json.load(file)
+                st = os.stat(file_path)
+                cached = _JSON_CACHE.get(file_path)
+                if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                    # 檔案未變動，使用深拷貝避免 set() 修改到快取內容
+                    self._config = copy.deepcopy(cached[2])
+                    return
+                loaded = _load_json_file(file_path)
+                if not isinstance(loaded, dict):
+                    raise ValueError("config root must be a JSON object")
+                # 以預設配置為基礎合併檔案內容，舊版檔案缺少的鍵值自動補齊
+                self._config = self._get_default_config()
+                self._config.update(loaded)
+                _JSON_CACHE[file_path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(self._config))
                 print(f"Load config from: {file_path}")
-            except (json.JSONDecodeError, FileNotFoundError) as e:
+            except (ValueError, FileNotFoundError) as e:
                 print(f"Load config failed: {e}, using default config")
                 self._config = self._get_default_config()
         else:
@@ -121,43 +252,29 @@ class GlobalConfig:
             self._config = self._get_default_config()
     
     def _get_default_config(self):
-        """取得預設配置字典。當 JSON 檔案不存在或解析失敗時使用。
+        """取得預設配置字典的副本。當 JSON 檔案不存在、解析失敗，或作為載入時的補齊基礎使用。
 
         Returns:
             dict: 包含所有預設配置項目的字典
         """
-        return {
-            "magnifier_switch": True,               # 放大鏡開關（預設開啟）
-            "circle_switch": False,                  # 圓形對齊點標記開關（預設關閉）
-            "last_folder_path": None,                # 上次開啟的資料夾路徑
-
-            # ===== 熱力圖標記的顏色與字型設定 =====
-            "heat_rect_color": "#BCBCBC",           # 熱力圖 - 矩形框顏色
-            "heat_name_color": "#FFFFFF",           # 熱力圖 - 元器件名稱顏色
-            "heat_name_font_size": 28,              # 熱力圖 - 元器件名稱字型大小
-            "heat_temp_color": "#FF0000",           # 熱力圖 - 最高溫度顏色
-            "heat_temp_font_size": 14,              # 熱力圖 - 最高溫度字型大小
-            "heat_rect_width": 2,                   # 熱力圖 - 矩形框線粗細 (1~5)
-            "heat_selected_color": "#4A90E2",       # 熱力圖 - 選中矩形框顏色
-            "heat_anchor_color": "#FF0000",         # 熱力圖 - 選中矩形框錨點顏色
-            "heat_anchor_radius": 4,                # 熱力圖 - 選中矩形框錨點半徑
-
-            # ===== Layout 圖標記的顏色與字型設定 =====
-            "layout_rect_color": "#BCBCBC",         # Layout 圖 - 矩形框顏色
-            "layout_name_color": "#FFFFFF",         # Layout 圖 - 元器件名稱顏色
-            "layout_name_font_size": 28,            # Layout 圖 - 元器件名稱字型大小
-            "layout_temp_color": "#FF0000",         # Layout 圖 - 最高溫度顏色
-            "layout_temp_font_size": 14,            # Layout 圖 - 最高溫度字型大小
-            "layout_rect_width": 2,                 # Layout 圖 - 矩形框線粗細 (1~5)
-        }
+        return dict(_DEFAULT_CONFIG)
 
     def update(self, newObj):
-        """批次更新配置。將 newObj 字典的內容合併覆蓋至目前配置。
+        """批次更新配置。將 newObj 字典中與目前配置不同的項目合併覆蓋至目前配置。
 
         Args:
             newObj (dict): 要合併的配置字典
+
+        Returns:
+            dict: 實際有變更的項目；全部相同時回傳空字典，呼叫端可據此略過重繪或儲存
         """
-        self._config.update(newObj)
+        config = self._config
+        changed = {k: v for k, v in newObj.items() if config.get(k, _SENTINEL) != v}
+        if changed:
+            config.update(changed)
+            self._dirty = True
+            self._version += 1
+        return changed
        
 
 
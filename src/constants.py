@@ -22,6 +22,14 @@ constants.py - 應用程式常數定義模組
     - points：溫度點位資料，記錄每個標記框的座標和溫度資訊
 """
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=2)
+def _point_path(image_path):
+    """依圖片檔名組出點位資料檔案路徑並快取（同一檔名只格式化一次）。"""
+    return f"points/{image_path}_points.csv"
+
 
 class Constants:
     """
@@ -51,7 +59,7 @@ class Constants:
             str: 熱力圖點位資料的相對檔案路徑，
                  例如 "points/imageA.jpg_points.csv"
         """
-        return f"points/{Constants.imageA_default_path}_points.csv"
+        return _point_path(Constants.imageA_default_path)
     
     @staticmethod
     def imageB_point_path():
@@ -66,4 +74,4 @@ class Constants:
             str: Layout 圖點位資料的相對檔案路徑，
                  例如 "points/imageB.jpg_points.csv"
         """
-        return f"points/{Constants.imageB_default_path}_points.csv"
+        return _point_path(Constants.imageB_default_path)
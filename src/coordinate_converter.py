@@ -20,11 +20,37 @@
 import numpy as np
 
 
+# 以左上角為基準時，各原點位置的 X / Y 軸是否反向
+_FLIP_X_ORIGINS = frozenset(("右上角", "右下角"))
+_FLIP_Y_ORIGINS = frozenset(("右下角", "左下角"))
+
+
+def _build_transform_table(origins):
+    """建立 (來源原點, 目標原點) → (sx, sy, kx, ky) 的轉換係數表。
+
+    任兩個原點之間的轉換皆可寫成 x_new = sx * x + kx * width、
+    y_new = sy * y + ky * height；當兩個原點在某一軸上的方向不同時，
+    該軸的 s 為 -1、k 為 1，否則 s 為 1、k 為 0。
+    """
+    table = {}
+    for from_origin in origins:
+        for to_origin in origins:
+            flip_x = (from_origin in _FLIP_X_ORIGINS) != (to_origin in _FLIP_X_ORIGINS)
+            flip_y = (from_origin in _FLIP_Y_ORIGINS) != (to_origin in _FLIP_Y_ORIGINS)
+            table[(from_origin, to_origin)] = (
+                -1 if flip_x else 1,
+                -1 if flip_y else 1,
+                1 if flip_x else 0,
+                1 if flip_y else 0,
+            )
+    return table
+
+
 class CoordinateConverter:
     """座標原點轉換器。
 
-    支援四個角落原點之間的座標互轉，透過先統一轉換為
-    左上角原點座標，再轉換為目標原點座標的兩步驟策略。
+    支援四個角落原點之間的座標互轉。任兩個原點之間的轉換係數
+    (sx, sy, kx, ky) 預先建立於 _TRANSFORM_TABLE，轉換時只需查表一次。
 
     屬性：
         width (int): 影像寬度（像素）
@@ -39,6 +65,9 @@ class CoordinateConverter:
         "右下角": "bottom_right",
         "左下角": "bottom_left"
     }
+
+    # 所有原點組合的轉換係數 (sx, sy, kx, ky)，於類別定義時一次建立
+    _TRANSFORM_TABLE = _build_transform_table(ORIGIN_POSITIONS)
     
     def __init__(self, image_width, image_height):
         """初始化座標轉換器。
@@ -49,6 +78,8 @@ class CoordinateConverter:
         """
         self.width = image_width
         self.height = image_height
+        # (來源原點, 目標原點, 寬, 高) → 3×3 齊次轉換矩陣，首次使用時建立
+        self._matrix_cache = {}
         
     def convert_coordinate(self, x, y, from_origin, to_origin):
         """座標轉換主函式。
@@ -62,85 +93,109 @@ class CoordinateConverter:
         Returns:
             tuple: (x_new, y_new) 轉換後的座標
         """
-        # 验证输入
-        if from_origin not in self.ORIGIN_POSITIONS:
-            raise ValueError(f"无效的源原点位置: {from_origin}")
-        if to_origin not in self.ORIGIN_POSITIONS:
-            raise ValueError(f"无效的目标原点位置: {to_origin}")
-            
-        # 如果原点相同，直接返回
-        if from_origin == to_origin:
-            return x, y
-            
-        # 先转换为左上角原点坐标
-        x_top_left, y_top_left = self._to_top_left_origin(x, y, from_origin)
-        
-        # 再从左上角原点转换为目标原点坐标
-        x_new, y_new = self._from_top_left_origin(x_top_left, y_top_left, to_origin)
-        
-        return x_new, y_new
-    
-    def _to_top_left_origin(self, x, y, origin):
-        """將任意原點座標轉換為左上角原點座標（內部方法）。
+        sx, sy, kx, ky = self._lookup_transform(from_origin, to_origin)
+        return sx * x + kx * self.width, sy * y + ky * self.height
+
+    def _lookup_transform(self, from_origin, to_origin):
+        """查詢兩個原點之間的轉換係數（內部方法）。
 
         Args:
-            x (float): 來源座標 X
-            y (float): 來源座標 Y
-            origin (str): 來源原點位置
+            from_origin (str): 來源原點位置
+            to_origin (str): 目標原點位置
 
         Returns:
-            tuple: (x_top_left, y_top_left) 左上角原點座標
+            tuple: (sx, sy, kx, ky) 轉換係數
+
+        Raises:
+            ValueError: 原點位置不在 ORIGIN_POSITIONS 中時拋出
         """
-        if origin == "左上角":
-            return x, y
-        elif origin == "右上角":
-            return self.width - x, y
-        elif origin == "右下角":
-            return self.width - x, self.height - y
-        elif origin == "左下角":
-            return x, self.height - y
-        else:
-            raise ValueError(f"无效的原点位置: {origin}")
-    
-    def _from_top_left_origin(self, x, y, origin):
-        """將左上角原點座標轉換為任意原點座標（內部方法）。
+        try:
+            return self._TRANSFORM_TABLE[(from_origin, to_origin)]
+        except KeyError:
+            if from_origin not in self.ORIGIN_POSITIONS:
+                raise ValueError(f"无效的源原点位置: {from_origin}") from None
+            raise ValueError(f"无效的目标原点位置: {to_origin}") from None
+
+    def batch_convert(self, coordinates, from_origin, to_origin, as_array=False):
+        """批次座標轉換。
 
         Args:
-            x (float): 左上角原點座標 X
-            y (float): 左上角原點座標 Y
-            origin (str): 目標原點位置
+            coordinates (list): 座標列表，格式為 [(x1, y1), (x2, y2), ...]
+            from_origin (str): 來源原點位置
+            to_origin (str): 目標原點位置
+            as_array (bool): 為 True 時直接回傳連續的 (N, 2) float32 陣列，
+                不再轉回 tuple 列表，可直接交給 NumPy / cv2 使用
 
         Returns:
-            tuple: (x_new, y_new) 目標原點座標
+            list | numpy.ndarray: 轉換後的座標列表（as_array=True 時為 (N, 2) float32 陣列）
         """
-        if origin == "左上角":
-            return x, y
-        elif origin == "右上角":
-            return self.width - x, y
-        elif origin == "右下角":
-            return self.width - x, self.height - y
-        elif origin == "左下角":
-            return x, self.height - y
-        else:
-            raise ValueError(f"无效的原点位置: {origin}")
-    
-    def batch_convert(self, coordinates, from_origin, to_origin):
-        """批次座標轉換。
+        if as_array:
+            coords = np.array(coordinates, dtype=np.float32).reshape(-1, 2)
+            return self.batch_convert_inplace(coords, from_origin, to_origin)
+
+        sx, sy, kx, ky = self._lookup_transform(from_origin, to_origin)
+
+        # 整批座標以一次 NumPy 運算完成：out = coords * (sx, sy) + (kx * width, ky * height)
+        coords = np.asarray(coordinates).reshape(-1, 2)
+        converted = coords * (sx, sy) + (kx * self.width, ky * self.height)
+        return [tuple(point) for point in converted.tolist()]
+
+    def batch_convert_inplace(self, coords, from_origin, to_origin):
+        """就地轉換 (N, 2) 浮點座標陣列，不配置新陣列，適合在繪製迴圈中重複使用同一緩衝區。
 
         Args:
-            coordinates (list): 座標列表，格式為 [(x1, y1), (x2, y2), ...]
+            coords (numpy.ndarray): (N, 2) 浮點座標陣列，會被直接修改
             from_origin (str): 來源原點位置
             to_origin (str): 目標原點位置
 
         Returns:
-            list: 轉換後的座標列表
+            numpy.ndarray: 同一個 coords 陣列（方便串接呼叫）
         """
-        converted_coords = []
-        for x, y in coordinates:
-            x_new, y_new = self.convert_coordinate(x, y, from_origin, to_origin)
-            converted_coords.append((x_new, y_new))
-        return converted_coords
-    
+        sx, sy, kx, ky = self._lookup_transform(from_origin, to_origin)
+        if sx < 0:
+            np.subtract(kx * self.width, coords[:, 0], out=coords[:, 0])
+        if sy < 0:
+            np.subtract(ky * self.height, coords[:, 1], out=coords[:, 1])
+        return coords
+
+    def get_matrix(self, from_origin, to_origin):
+        """取得兩個原點之間的 3×3 齊次座標轉換矩陣。
+
+        矩陣形式為 [[sx, 0, kx*width], [0, sy, ky*height], [0, 0, 1]]，
+        可與其他仿射矩陣（如 point_transformer.py 的對齊矩陣）先相乘合併，
+        再對座標做一次矩陣乘法，省去一次完整的座標轉換。
+
+        Args:
+            from_origin (str): 來源原點位置
+            to_origin (str): 目標原點位置
+
+        Returns:
+            numpy.ndarray: (3, 3) float64 唯讀轉換矩陣
+        """
+        key = (from_origin, to_origin, self.width, self.height)
+        matrix = self._matrix_cache.get(key)
+        if matrix is None:
+            sx, sy, kx, ky = self._lookup_transform(from_origin, to_origin)
+            matrix = np.array([[sx, 0, kx * self.width],
+                               [0, sy, ky * self.height],
+                               [0, 0, 1]], dtype=np.float64)
+            matrix.setflags(write=False)
+            self._matrix_cache[key] = matrix
+        return matrix
+
+    def batch_convert_homogeneous(self, points_xy1, from_origin, to_origin):
+        """以齊次座標批次轉換座標。
+
+        Args:
+            points_xy1 (numpy.ndarray): (N, 3) 齊次座標陣列，每列為 (x, y, 1)
+            from_origin (str): 來源原點位置
+            to_origin (str): 目標原點位置
+
+        Returns:
+            numpy.ndarray: (N, 3) 轉換後的齊次座標陣列
+        """
+        return np.asarray(points_xy1) @ self.get_matrix(from_origin, to_origin).T
+
     def get_available_origins(self):
         """取得可用的原點位置列表。
 
@@ -18,15 +18,31 @@
     - bean/canvas_rect_item.py：提供 oldRect 資料來源
 
 UI 元件對應命名：
-    - fields (list): 輸入欄位列表，每項包含 (key, label, Entry 元件)
+    - _FIELD_SPECS (tuple): 欄位規格，每項包含 (key, label, 是否唯讀)
+    - _entries (dict): 欄位鍵名對應的 Entry 元件
     - confirm_button (tk.Button): 「確認」按鈕
     - frame (tk.Frame): 主要內容框架（含 20px 內邊距）
 """
 
+import math
 import tkinter as tk
 from tkinter import messagebox
 
 
+# 回傳欄位的型別轉換表：name 保留字串，其餘轉為 float；
+# 不在表中的欄位（avg_temp、_orient）僅供顯示，不回傳
+_FIELD_TYPES = {
+    "name": str,
+    "max_temp": float,
+    "cx": float,
+    "cy": float,
+    "x1": float,
+    "y1": float,
+    "x2": float,
+    "y2": float,
+}
+
+
 class ComponentSettingDialog(tk.Toplevel):
     """元器件屬性編輯對話框。
 
@@ -36,9 +52,24 @@ class ComponentSettingDialog(tk.Toplevel):
     屬性：
         oldRect (dict): 原始的矩形框資料字典
         callback (callable): 確認後的回呼函式，接收修改後的資料字典
-        fields (list): 輸入欄位列表 [(key, label, Entry), ...]
+        _entries (dict): 欄位鍵名 → 輸入框（tk.Entry）
     """
 
+    # 欄位規格 (key, label, 是否唯讀)；僅在排版時才建立對應的 Entry 元件
+    _FIELD_SPECS = (
+        ("name", "器件名称: ", False),
+        ("max_temp", "最高温度: ", True),
+        ("avg_temp", "平均温度: ", True),
+        ("_orient", "Orient.: ", True),
+        # 其他字段暂时注释掉
+        # ("cx", "最高温度 x坐标: ", False),
+        # ("cy", "最高温度 y坐标: ", False),
+        # ("x1", "左上角 x坐标: ", False),
+        # ("y1", "左上角 y坐标: ", False),
+        # ("x2", "右下角 x坐标: ", False),
+        # ("y2", "右下角 y坐标: ", False),
+    )
+
     def __init__(self, parent, oldRect, callback):
         """初始化元器件編輯對話框。
 
@@ -61,46 +92,33 @@ class ComponentSettingDialog(tk.Toplevel):
         frame = tk.Frame(self, padx=20, pady=20)  # 通过 Frame 设置内边距
         frame.pack(fill=tk.BOTH, expand=True)
 
-        # 创建字段标签和输入框（只显示器件名称和最高温度）
-        self.fields = [
-            ("name", "器件名称: ", tk.Entry(frame)),
-            ("max_temp", "最高温度: ", tk.Entry(frame)),
-            ("avg_temp", "平均温度: ", tk.Entry(frame)),
-            ("_orient", "Orient.: ", tk.Entry(frame)),
-            # 其他字段暂时注释掉
-            # ("cx", "最高温度 x坐标: ", tk.Entry(frame)),
-            # ("cy", "最高温度 y坐标: ", tk.Entry(frame)),
-            # ("x1", "左上角 x坐标: ", tk.Entry(frame)),
-            # ("y1", "左上角 y坐标: ", tk.Entry(frame)),
-            # ("x2", "右下角 x坐标: ", tk.Entry(frame)),
-            # ("y2", "右下角 y坐标: ", tk.Entry(frame))
-        ]
         # print("xxx ", oldRect, callback)
         self.oldRect  = oldRect
         self.callback = callback
 
-        # 创建输入字段布局
-        for idx, (key, label, entry) in enumerate(self.fields):
+        # 依欄位規格一次建立標籤與輸入框並完成排版、填值
+        self._entries = {}
+        for idx, (key, label, readonly) in enumerate(self._FIELD_SPECS):
             tk.Label(frame, text=label).grid(row=idx, column=0, padx=10, pady=5, sticky="e")
+            entry = tk.Entry(frame)
             if oldRect:
                 if key == "_orient":
                     # Orient. 顯示原始值，從 angle 欄位讀取
                     raw_orient = oldRect.get("angle", None)
-                    import math
                     if raw_orient is None or (isinstance(raw_orient, float) and math.isnan(raw_orient)):
                         entry.insert(0, "空值")
                     else:
                         entry.insert(0, raw_orient)
-                    entry.config(state='readonly')
                 else:
                     entry.insert(0, oldRect.get(key, 0))  # 将 oldRect[key] 的值插入到 entry 中
-                    if key in ("max_temp", "avg_temp"):  # 温度字段设为只读
-                        entry.config(state='readonly')
+                if readonly:  # 温度、Orient. 字段设为只读
+                    entry.config(state='readonly')
             entry.grid(row=idx, column=1, padx=10, pady=5)
+            self._entries[key] = entry
 
         # 创建确认按钮
         self.confirm_button = tk.Button(frame, text="   确认   ", command=self.on_confirm)
-        self.confirm_button.grid(row=len(self.fields), column=0, columnspan=2, pady=(20, 0))
+        self.confirm_button.grid(row=len(self._FIELD_SPECS), column=0, columnspan=2, pady=(20, 0))
 
     def center_window(self):
         """將對話框置中於螢幕。"""
@@ -115,28 +133,26 @@ class ComponentSettingDialog(tk.Toplevel):
 
     def on_confirm(self):
         """確認按鈕點擊事件處理器。驗證輸入值、保留原始座標資料，並透過 callback 回傳結果。"""
-        values = {}
-        for key, label, entry in self.fields:
-            if key in ("_orient", "avg_temp"):  # 唯讀顯示欄位，不回傳
-                continue
-            value = entry.get()
-            if key == "name":  # 对"器件名称"字段不做类型转换，保留字符串
-                values[key] = value
-            else:
+        raw = {key: self._entries[key].get() for key in _FIELD_TYPES if key in self._entries}
+        try:
+            values = {key: _FIELD_TYPES[key](value) for key, value in raw.items()}
+        except ValueError:
+            # 只在出错时才逐栏找出第一个无法转换的字段，用于提示
+            for key, label, readonly in self._FIELD_SPECS:
+                if key not in raw:
+                    continue
                 try:
-                    # 尝试转换为float，如果失败，则提示错误
-                    values[key] = float(value)
+                    _FIELD_TYPES[key](raw[key])
                 except ValueError:
                     messagebox.showerror("输入错误", f"'{label}' 必须是数字类型！")
                     return
+            return
         
         # 🔥 重要：保留原始矩形框的所有坐标数据
         # 对话框只允许修改name和max_temp，其他字段保持不变
         if self.oldRect:
-            # 保留oldRect中所有未在对话框中显示的字段
-            for key, value in self.oldRect.items():
-                if key not in values:
-                    values[key] = value
+            # 保留oldRect中所有未在对话框中显示的字段（对话框中的值优先）
+            values = {**self.oldRect, **values}
         
         # 由于只显示器件名称和最高温度，不需要坐标验证
         # 注释掉坐标验证逻辑
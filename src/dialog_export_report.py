@@ -28,6 +28,14 @@ except ImportError:
     from ui_style import UIStyle
 
 
+# Radio 選項 (value, 顯示文字)
+_EXPORT_OPTIONS = (
+    ("High_Vac_Data", "High_Vac_Data"),
+    ("Low_Vac_Data", "Low_Vac_Data"),
+    ("custom", "自訂"),
+)
+
+
 class ExportReportDialog:
     """測試報告 Sheet 名稱選擇對話框。
 
@@ -74,13 +82,7 @@ class ExportReportDialog:
         # Radio 選項
         self.sheet_var = tk.StringVar(value="High_Vac_Data")
 
-        options = [
-            ("High_Vac_Data", "High_Vac_Data"),
-            ("Low_Vac_Data", "Low_Vac_Data"),
-            ("custom", "自訂"),
-        ]
-
-        for value, text in options:
+        for value, text in _EXPORT_OPTIONS:
             rb = ttk.Radiobutton(main_frame, text=text, variable=self.sheet_var,
                                  value=value, command=self._on_radio_change)
             rb.pack(anchor=tk.W, pady=2)
@@ -125,6 +127,11 @@ class ExportReportDialog:
         else:
             sheet_name = selected
 
-        self.dialog.destroy()
-        if self.callback:
-            self.callback(sheet_name)
+        # 先隱藏視窗讓使用者立即看到對話框關閉，寫入報告等耗時工作完成後才真正銷毀
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        try:
+            if self.callback:
+                self.callback(sheet_name)
+        finally:
+            self.dialog.destroy()
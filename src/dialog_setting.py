@@ -30,11 +30,65 @@ UI 元件對應命名：
     - cancel_button (tk.Button): 「取消」按鈕
 """
 
+import re
+from functools import partial
 import tkinter as tk
 from tkinter import ttk, colorchooser
 from config import GlobalConfig
 
 
+# 對話框各設定項的預設值（配置中缺少該鍵時使用），於匯入時建立一次
+_DEFAULTS = {
+    # 热力图标记
+    "heat_rect_color": "#BCBCBC",
+    "heat_name_color": "#FFFFFF",
+    "heat_name_font_size": 12,
+    "heat_temp_color": "#FF0000",
+    "heat_temp_font_size": 10,
+    "heat_selected_color": "#4A90E2",
+    "heat_anchor_color": "#FF0000",
+    "heat_anchor_radius": 4,
+    "heat_rect_width": 2,
+
+    # Layout图标记
+    "layout_rect_color": "#BCBCBC",
+    "layout_name_color": "#FFFFFF",
+    "layout_name_font_size": 12,
+    "layout_temp_color": "#FF0000",
+    "layout_temp_font_size": 10,
+    "layout_rect_width": 2,
+}
+
+# 合法的顏色字串 #RRGGBB（draw_rect.py 以 hex 逐位解析，其他格式無法使用）
+_HEX_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+# 數值輸入框的逐鍵驗證：直接交給 Tcl 的 `string is digit` 判斷（空字串視為合法），
+# 每次按鍵不必回呼 Python；%P 為按鍵後的內容，Tk 會自動加上適當的 Tcl 引號
+_DIGITS_VCMD = "string is digit %P"
+
+# 「熱力圖標記」群組的設定列 (標籤, 配置鍵名, 控件類型)，依序對應 Grid 行號
+_HEAT_ROWS = (
+    ("矩形框颜色", "heat_rect_color", "color"),
+    ("元器件名称颜色", "heat_name_color", "color"),
+    ("元器件名称字体大小(px)", "heat_name_font_size", "font"),
+    ("最高温度颜色", "heat_temp_color", "color"),
+    ("最高温度字体大小(px)", "heat_temp_font_size", "font"),
+    ("选中矩形框颜色", "heat_selected_color", "color"),
+    ("选中矩形框锚点颜色", "heat_anchor_color", "color"),
+    ("选中矩形框锚点半径(px)", "heat_anchor_radius", "font"),
+    ("矩形框线粗细(px)", "heat_rect_width", "width"),
+)
+
+# 「Layout 圖標記」群組的設定列
+_LAYOUT_ROWS = (
+    ("矩形框颜色", "layout_rect_color", "color"),
+    ("元器件名称颜色", "layout_name_color", "color"),
+    ("元器件名称字体大小(px)", "layout_name_font_size", "font"),
+    ("最高温度颜色", "layout_temp_color", "color"),
+    ("最高温度字体大小(px)", "layout_temp_font_size", "font"),
+    ("矩形框线粗细(px)", "layout_rect_width", "width"),
+)
+
 class SettingDialog:
     """顯示設定對話框。
 
@@ -61,32 +115,59 @@ class SettingDialog:
         self.master = master
         self.settings_button = settings_button
         self.callback = callback  # 接收外部传入的回调函数
-        self.dialog_result = {}
+        self.dialog_result = {}  # 最近一次确认时实际变更的设置 {config_key: 新值}
+        self._initial_snapshot = {}
+        self._last_color = "#FFFFFF"  # 最近一次在颜色选择器中选定的颜色（所有颜色项共用）
         self.config = GlobalConfig()
         self.dialog = None  # 对话框实例，用于单例模式
+        self._dialog_alive = False  # 对话框是否正在显示（Python 端记录，免去每次点击都向 Tcl 查询）
+        self._layout_build_after = None  # 延后建立 Layout 群组控件的 after_idle 任务 ID
+        # 各设定项的控件引用（config_key -> 控件），供事件处理与重新开启时回填数值
+        self._color_widgets = {}  # config_key -> (RGB 输入框的 StringVar, 颜色预览)
+        self._font_widgets = {}  # config_key -> 数值输入框
+        self._width_vars = {}  # config_key -> 下拉选单的 StringVar
 
     def open(self):
-        """開啟設定對話框。若已存在則提到前台，否則建立新對話框。"""
+        """開啟設定對話框。
+
+        首次開啟時建立視窗；關閉後視窗只是隱藏（withdraw），再次開啟時重新載入
+        設定值回填各控件後直接顯示（deiconify），不必重建整個控件樹。
+        """
+        if self._dialog_alive:
+            # 对话框正在显示，将其提到前台
+            try:
+                self.dialog.lift()
+                self.dialog.focus_force()
+                return
+            except tk.TclError:
+                # 窗口已被外部销毁，改为重新建立
+                self._dialog_alive = False
+                self._cancel_layout_build()
+                self.dialog = None
+
         if self.dialog is not None and self.dialog.winfo_exists():
-            # 如果对话框已存在，将其提到前台
+            # 重用已隐藏的对话框：重新载入配置并回填控件
+            self.load_color_settings()
+            self._refresh_widgets()
+            self._place_dialog()
+            self.dialog.deiconify()
+            self.dialog.grab_set()
             self.dialog.lift()
             self.dialog.focus_force()
+            self._dialog_alive = True
             return
         
-        # 创建新的对话框
+        # 创建新的对话框（先隐藏，控件全部建立完成后再一次显示，避免每次 pack/grid 都触发重绘）
         self.dialog = tk.Toplevel(self.master)
+        self.dialog.withdraw()
         self.dialog.title("设置")
+        self._color_widgets = {}
+        self._font_widgets = {}
+        self._width_vars = {}
         
         # 设置对话框关闭时的回调
         self.dialog.protocol("WM_DELETE_WINDOW", self.on_dialog_close)
 
-        # 获取设置按钮的坐标，显示在按钮下方
-        x = self.settings_button.winfo_rootx() - 7  # 按钮的 x 坐标
-        y = self.settings_button.winfo_rooty() + self.settings_button.winfo_height() + 5  # 按钮下方的位置
-
-        # 设置对话框的位置和大小
-        self.dialog.geometry(f"500x660+{x}+{y}")
-
         # 创建主框架
         main_frame = tk.Frame(self.dialog)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
@@ -97,43 +178,12 @@ class SettingDialog:
         # 热力图标记设置
         heat_frame = ttk.LabelFrame(main_frame, text="热力图标记", padding=8)
         heat_frame.pack(fill=tk.X, padx=5, pady=5)
+        self._build_rows(heat_frame, _HEAT_ROWS)
 
-        # 矩形框颜色
-        self.create_color_setting(heat_frame, "矩形框颜色", "heat_rect_color", "#BCBCBC", 0)
-        # 元器件名称颜色
-        self.create_color_setting(heat_frame, "元器件名称颜色", "heat_name_color", "#FFFFFF", 1)
-        # 元器件名称字体大小
-        self.create_font_setting(heat_frame, "元器件名称字体大小(px)", "heat_name_font_size", 12, 2)
-        # 最高温度颜色
-        self.create_color_setting(heat_frame, "最高温度颜色", "heat_temp_color", "#FF0000", 3)
-        # 最高温度字体大小
-        self.create_font_setting(heat_frame, "最高温度字体大小(px)", "heat_temp_font_size", 10, 4)
-        # 选中矩形框颜色
-        self.create_color_setting(heat_frame, "选中矩形框颜色", "heat_selected_color", "#4A90E2", 5)
-        # 选中矩形框锚点颜色
-        self.create_color_setting(heat_frame, "选中矩形框锚点颜色", "heat_anchor_color", "#FF0000", 6)
-        # 选中矩形框锚点半径
-        self.create_font_setting(heat_frame, "选中矩形框锚点半径(px)", "heat_anchor_radius", 4, 7)
-        # 矩形框线粗细
-        self.create_width_setting(heat_frame, "矩形框线粗细(px)", "heat_rect_width", 2, 8)
-
-        # Layout图标记设置
+        # Layout图标记设置（群组框先占位，内部控件在空闲时再建立，加快首次显示）
         layout_frame = ttk.LabelFrame(main_frame, text="Layout图标记", padding=8)
         layout_frame.pack(fill=tk.X, padx=5, pady=5)
 
-        # 矩形框颜色
-        self.create_color_setting(layout_frame, "矩形框颜色", "layout_rect_color", "#BCBCBC", 0)
-        # 元器件名称颜色
-        self.create_color_setting(layout_frame, "元器件名称颜色", "layout_name_color", "#FFFFFF", 1)
-        # 元器件名称字体大小
-        self.create_font_setting(layout_frame, "元器件名称字体大小(px)", "layout_name_font_size", 12, 2)
-        # 最高温度颜色
-        self.create_color_setting(layout_frame, "最高温度颜色", "layout_temp_color", "#FF0000", 3)
-        # 最高温度字体大小
-        self.create_font_setting(layout_frame, "最高温度字体大小(px)", "layout_temp_font_size", 10, 4)
-        # 矩形框线粗细
-        self.create_width_setting(layout_frame, "矩形框线粗细(px)", "layout_rect_width", 2, 5)
-
         # 确认按钮
         button_frame = tk.Frame(main_frame)
         button_frame.pack(fill=tk.X, padx=5, pady=10)
@@ -144,33 +194,156 @@ class SettingDialog:
         cancel_button = tk.Button(button_frame, text="取消", command=self.on_dialog_close, width=10)
         cancel_button.pack(side=tk.RIGHT, padx=5)
 
-        # 设置对话框为模态，但不阻塞主线程
+        # 隐藏状态下一次完成版面计算，再设置位置、模态并显示
+        self.dialog.update_idletasks()
+        self._place_dialog()
         self.dialog.transient(self.master)
+        self.dialog.deiconify()
+        # 设置对话框为模态，但不阻塞主线程
         self.dialog.grab_set()
+        self._dialog_alive = True
 
-    def load_color_settings(self):
-        """從 GlobalConfig 載入所有顏色和字型設定值。"""
-        # 默认颜色配置
-        self.color_settings = {
-            # 热力图标记
-            "heat_rect_color": self.config.get("heat_rect_color", "#BCBCBC"),
-            "heat_name_color": self.config.get("heat_name_color", "#FFFFFF"),
-            "heat_name_font_size": self.config.get("heat_name_font_size", 12),
-            "heat_temp_color": self.config.get("heat_temp_color", "#FF0000"),
-            "heat_temp_font_size": self.config.get("heat_temp_font_size", 10),
-            "heat_selected_color": self.config.get("heat_selected_color", "#4A90E2"),
-            "heat_anchor_color": self.config.get("heat_anchor_color", "#FF0000"),
-            "heat_anchor_radius": self.config.get("heat_anchor_radius", 4),
-            "heat_rect_width": self.config.get("heat_rect_width", 2),
-
-            # Layout图标记
-            "layout_rect_color": self.config.get("layout_rect_color", "#BCBCBC"),
-            "layout_name_color": self.config.get("layout_name_color", "#FFFFFF"),
-            "layout_name_font_size": self.config.get("layout_name_font_size", 12),
-            "layout_temp_color": self.config.get("layout_temp_color", "#FF0000"),
-            "layout_temp_font_size": self.config.get("layout_temp_font_size", 10),
-            "layout_rect_width": self.config.get("layout_rect_width", 2),
+        # Layout 群组控件在显示后的空闲时间再建立（须排在 update_idletasks 之后，否则会被提前执行）
+        self._layout_build_after = self.dialog.after_idle(self._build_layout_section, layout_frame)
+
+    def _place_dialog(self):
+        """將對話框定位在設定按鈕正下方（按鈕位置可能隨主視窗移動，每次開啟都重新計算）。"""
+        # 获取设置按钮的坐标，显示在按钮下方
+        x = self.settings_button.winfo_rootx() - 7  # 按钮的 x 坐标
+        y = self.settings_button.winfo_rooty() + self.settings_button.winfo_height() + 5  # 按钮下方的位置
+        self.dialog.geometry(f"500x660+{x}+{y}")
+
+    def _refresh_widgets(self):
+        """以目前的 color_settings 回填所有已建立的設定控件。"""
+        for config_key, (color_var, color_preview) in self._color_widgets.items():
+            value = self.color_settings.get(config_key, _DEFAULTS[config_key])
+            color_var.set(value)
+            try:
+                color_preview.config(bg=value)
+            except tk.TclError:
+                pass
+        for config_key, value_entry in self._font_widgets.items():
+            value_entry.delete(0, tk.END)
+            value_entry.insert(0, str(self.color_settings.get(config_key, _DEFAULTS[config_key])))
+        for config_key, width_var in self._width_vars.items():
+            width_var.set(str(int(self.color_settings.get(config_key, _DEFAULTS[config_key]))))
+
+    def _build_layout_section(self, layout_frame):
+        """建立「Layout 圖標記」群組內的設定控件（由 open() 以 after_idle 延後執行）。
+
+        Args:
+            layout_frame (ttk.LabelFrame): Layout 圖標記群組框
+        """
+        self._layout_build_after = None
+        if not layout_frame.winfo_exists():
+            # 对话框已被外部销毁（未经 on_dialog_close 取消任务）
+            return
+        self._build_rows(layout_frame, _LAYOUT_ROWS)
+
+    def _build_rows(self, parent, rows):
+        """依設定列表逐列建立控件，依控件類型分派至對應的 create_*_setting。
+
+        Args:
+            parent (tk.Widget): 父元件（群組框）
+            rows (tuple): (標籤, 配置鍵名, 控件類型) 的序列
+        """
+        creators = {
+            "color": self.create_color_setting,
+            "font": self.create_font_setting,
+            "width": self.create_width_setting,
         }
+        parent.grid_columnconfigure(0, weight=1)
+        for row, (label_text, config_key, kind) in enumerate(rows):
+            creators[kind](parent, label_text, config_key, _DEFAULTS[config_key], row)
+
+    def _make_row(self, parent, label_text, row):
+        """建立一列設定的共用骨架：列框架 + 左側名稱標籤。
+
+        Args:
+            parent (tk.Widget): 父元件（群組框）
+            label_text (str): 設定項目名稱
+            row (int): Grid 行號
+
+        Returns:
+            tk.Frame: 列框架，後續控件依序 pack 於標籤右側
+        """
+        frame = tk.Frame(parent)
+        frame.grid(row=row, column=0, sticky="ew", padx=5, pady=2)
+        tk.Label(frame, text=label_text, width=20, anchor="w").pack(side=tk.LEFT, padx=(0, 10))
+        return frame
+
+    def load_color_settings(self):
+        """從 GlobalConfig 一次批次載入所有顏色和字型設定值。"""
+        self.color_settings = self.config.get_many(_DEFAULTS)
+        # 开启时的快照，确认时据此找出实际变更的设置
+        self._initial_snapshot = dict(self.color_settings)
+
+    def _commit_entries(self):
+        """套用所有輸入框目前的內容（確認前呼叫，避免焦點仍在輸入框時遺漏最後的輸入）。"""
+        for config_key in self._color_widgets:
+            self._on_color_commit(config_key)
+        for config_key in self._font_widgets:
+            self._on_font_commit(config_key)
+
+    def _on_color_commit(self, config_key, event=None):
+        """顏色輸入框提交（焦點離開 / Enter）：更新預覽方塊與設定值。
+
+        Args:
+            config_key (str): 配置鍵名
+            event (tk.Event): Tk 事件（直接呼叫時為 None）
+        """
+        color_var, color_preview = self._color_widgets[config_key]
+        color_value = color_var.get()
+        # 不合法的色码（如输入到一半的 "#FF"）直接略过，不送给 Tk 产生 TclError
+        if not _HEX_RE.match(color_value):
+            return
+        color_preview.config(bg=color_value)
+        self.color_settings[config_key] = color_value
+
+    def _on_font_commit(self, config_key, event=None):
+        """數值輸入框提交（焦點離開 / Enter）：解析整數並更新設定值。
+
+        Args:
+            config_key (str): 配置鍵名
+            event (tk.Event): Tk 事件（直接呼叫時為 None）
+        """
+        try:
+            self.color_settings[config_key] = int(self._font_widgets[config_key].get())
+        except ValueError:
+            pass
+
+    def _on_width_change(self, config_key, event=None):
+        """框線粗細下拉選單變更：更新設定值。
+
+        Args:
+            config_key (str): 配置鍵名
+            event (tk.Event): Tk 事件
+        """
+        try:
+            self.color_settings[config_key] = int(self._width_vars[config_key].get())
+        except ValueError:
+            pass
+
+    def _choose_color(self, config_key, label_text):
+        """「選擇顏色」按鈕：開啟顏色選擇器，選定後寫回輸入框並更新預覽。
+
+        Args:
+            config_key (str): 配置鍵名
+            label_text (str): 設定項目名稱（用於選擇器標題）
+        """
+        color_var, color_preview = self._color_widgets[config_key]
+        # 以输入框目前的内容作为选择器初始色（含使用者刚输入、尚未提交的值）；
+        # 内容不合法时改用最近一次选过的颜色
+        current_color = color_var.get()
+        if not _HEX_RE.match(current_color):
+            current_color = self._last_color
+        color = colorchooser.askcolor(title=f"选择{label_text}", color=current_color)[1]
+        if color:
+            self._last_color = color
+            # 选择器回传的已是合法色码，直接更新输入框、预览与设置值，不必再从输入框读回
+            color_var.set(color)
+            color_preview.config(bg=color)
+            self.color_settings[config_key] = color
 
     def create_color_setting(self, parent, label_text, config_key, default_color, row):
         """建立顏色設定控件（標籤 + 顏色預覽 + RGB 輸入框 + 選擇按鈕）。
@@ -182,13 +355,7 @@ class SettingDialog:
             default_color (str): 預設顏色值
             row (int): Grid 行號
         """
-        frame = tk.Frame(parent)
-        frame.grid(row=row, column=0, sticky="ew", padx=5, pady=2)
-        parent.grid_columnconfigure(0, weight=1)
-
-        # 标签
-        label = tk.Label(frame, text=label_text, width=20, anchor="w")
-        label.pack(side=tk.LEFT, padx=(0, 10))
+        frame = self._make_row(parent, label_text, row)
 
         # 颜色显示框
         color_frame = tk.Frame(frame, width=30, height=25, relief="sunken", borderwidth=1)
@@ -203,30 +370,19 @@ class SettingDialog:
         color_preview.pack(fill=tk.BOTH, expand=True)
 
         # RGB输入框
-        rgb_entry = tk.Entry(frame, width=10)
-        rgb_entry.insert(0, current_color)
+        color_var = tk.StringVar(value=current_color)
+        rgb_entry = tk.Entry(frame, width=10, textvariable=color_var)
         rgb_entry.pack(side=tk.LEFT, padx=(0, 5))
+        self._color_widgets[config_key] = (color_var, color_preview)
 
-        def update_color_preview():
-            color_value = rgb_entry.get()
-            try:
-                color_preview.config(bg=color_value)
-                self.color_settings[config_key] = color_value
-            except:
-                pass
-
-        # 绑定RGB输入框变化事件
-        rgb_entry.bind('<KeyRelease>', lambda e: update_color_preview())
+        # 焦点离开或按 Enter 时才更新预览
+        on_commit = partial(self._on_color_commit, config_key)
+        rgb_entry.bind('<FocusOut>', on_commit)
+        rgb_entry.bind('<Return>', on_commit)
 
         # 颜色选择按钮
-        def choose_color():
-            color = colorchooser.askcolor(title=f"选择{label_text}", color=current_color)[1]
-            if color:
-                rgb_entry.delete(0, tk.END)
-                rgb_entry.insert(0, color)
-                update_color_preview()
-
-        color_button = tk.Button(frame, text="选择颜色", command=choose_color, width=8)
+        color_button = tk.Button(frame, text="选择颜色", command=partial(self._choose_color, config_key, label_text),
+                                 width=8)
         color_button.pack(side=tk.LEFT, padx=(5, 0))
 
     def create_font_setting(self, parent, label_text, config_key, default_value, row):
@@ -239,29 +395,20 @@ class SettingDialog:
             default_value (int): 預設字型大小
             row (int): Grid 行號
         """
-        frame = tk.Frame(parent)
-        frame.grid(row=row, column=0, sticky="ew", padx=5, pady=2)
-        parent.grid_columnconfigure(0, weight=1)
-
-        # 标签
-        label = tk.Label(frame, text=label_text, width=20, anchor="w")
-        label.pack(side=tk.LEFT, padx=(0, 10))
+        frame = self._make_row(parent, label_text, row)
 
         # 数值输入框
-        value_entry = tk.Entry(frame, width=10)
+        # 只允许输入数字，非法按键在 Tcl 层直接被拒绝
+        value_entry = tk.Entry(frame, width=10, validate="key", validatecommand=_DIGITS_VCMD)
         current_value = self.color_settings.get(config_key, default_value)
         value_entry.insert(0, str(current_value))
         value_entry.pack(side=tk.LEFT, padx=(0, 5))
+        self._font_widgets[config_key] = value_entry
 
-        def update_font_value():
-            try:
-                value = int(value_entry.get())
-                self.color_settings[config_key] = value
-            except ValueError:
-                pass
-
-        # 绑定输入框变化事件
-        value_entry.bind('<KeyRelease>', lambda e: update_font_value())
+        # 焦点离开或按 Enter 时才解析数值
+        on_commit = partial(self._on_font_commit, config_key)
+        value_entry.bind('<FocusOut>', on_commit)
+        value_entry.bind('<Return>', on_commit)
 
     def create_width_setting(self, parent, label_text, config_key, default_value, row):
         """建立框線粗細設定控件（標籤 + 下拉選單 1~5）。
@@ -273,13 +420,7 @@ class SettingDialog:
             default_value (int): 預設粗細值
             row (int): Grid 行號
         """
-        frame = tk.Frame(parent)
-        frame.grid(row=row, column=0, sticky="ew", padx=5, pady=2)
-        parent.grid_columnconfigure(0, weight=1)
-
-        # 标签
-        label = tk.Label(frame, text=label_text, width=20, anchor="w")
-        label.pack(side=tk.LEFT, padx=(0, 10))
+        frame = self._make_row(parent, label_text, row)
 
         # 下拉选单
         current_value = self.color_settings.get(config_key, default_value)
@@ -287,40 +428,39 @@ class SettingDialog:
         width_combo = ttk.Combobox(frame, textvariable=width_var, values=["1", "2", "3", "4", "5"],
                                    width=7, state="readonly")
         width_combo.pack(side=tk.LEFT, padx=(0, 5))
+        self._width_vars[config_key] = width_var
 
-        def on_width_change(event=None):
-            try:
-                value = int(width_var.get())
-                self.color_settings[config_key] = value
-            except ValueError:
-                pass
-
-        width_combo.bind('<<ComboboxSelected>>', on_width_change)
+        width_combo.bind('<<ComboboxSelected>>', partial(self._on_width_change, config_key))
 
     def on_confirm(self):
         """確認按鈕點擊事件。儲存所有設定至 config.json 並通知主介面刷新。"""
-        # 保存放大镜开关设置
-        self.config.set("magnifier_switch", True)
-        
-        # 保存所有颜色和字体设置
-        for key, value in self.color_settings.items():
-            self.config.set(key, value)
+        # 先套用输入框中尚未提交的内容
+        self._commit_entries()
+
+        # 放大镜开关与所有颜色、字体设置一次批次写入配置
+        settings = dict(self.color_settings, magnifier_switch=True)
+        self.config.update(settings)
         
-        # 同步主窗口中的配置缓存，确保即时生效
-        try:
-            if hasattr(self.master, 'config') and self.master.config:
-                self.master.config.set("magnifier_switch", True)
-                for key, value in self.color_settings.items():
-                    self.master.config.set(key, value)
-        except Exception:
-            pass
+        # 同步主窗口中的配置缓存，确保即时生效（GlobalConfig 为单例，通常是同一个对象，无需重复写入）
+        master_config = getattr(self.master, 'config', None)
+        if master_config is not None and master_config is not self.config:
+            try:
+                master_config.update(settings)
+            except Exception:
+                pass
         
         # 保存到JSON文件
         self.config.save_to_json()
         
+        # 找出相对开启时实际变更的设置；都没变时不必触发整个画布重绘
+        snapshot = self._initial_snapshot
+        changed = {k: v for k, v in self.color_settings.items() if snapshot.get(k) != v}
+        self.dialog_result = changed
+        self._initial_snapshot = dict(self.color_settings)
+
         # 即时生效：通知主界面刷新显示
         try:
-            if hasattr(self.master, 'update_content'):
+            if changed and hasattr(self.master, 'update_content'):
                 self.master.update_content()
         except Exception:
             pass
@@ -329,7 +469,37 @@ class SettingDialog:
         self.on_dialog_close()
 
     def on_dialog_close(self):
-        """對話框關閉時的回呼。銷毀視窗並重設實例變數。"""
-        if self.dialog is not None:
-            self.dialog.destroy()
+        """對話框關閉時的回呼。隱藏視窗並釋放模態鎖定，保留控件供下次開啟重用。"""
+        if not self._dialog_alive:
+            return
+        self._dialog_alive = False
+        if self._cancel_layout_build():
+            # Layout 群组尚未建立就被关闭：直接销毁这个不完整的对话框，下次开启时重新建立
+            try:
+                self.dialog.destroy()
+            except tk.TclError:
+                pass
             self.dialog = None
+            return
+        try:
+            self.dialog.grab_release()
+            self.dialog.withdraw()
+        except tk.TclError:
+            # 窗口已被外部销毁
+            self.dialog = None
+
+    def _cancel_layout_build(self):
+        """取消尚未執行的 Layout 群組延後建立任務。
+
+        Returns:
+            bool: 確實取消了待執行的任務時回傳 True
+        """
+        after_id = self._layout_build_after
+        if after_id is None:
+            return False
+        self._layout_build_after = None
+        try:
+            self.dialog.after_cancel(after_id)
+        except tk.TclError:
+            pass
+        return True
@@ -16,7 +16,6 @@
 關聯檔案：
     - main.py：建立 TemplateDialog 實例
     - temperature_config_manager.py：儲存/讀取溫度配置參數
-    - config.py：全域配置管理器
     - recognize_image.py：使用本對話框設定的參數進行識別
 
 UI 元件對應命名：
@@ -25,16 +24,74 @@ UI 元件對應命名：
     - max_temp_entry (ttk.Entry): 最高溫度輸入框
     - p_w_entry (ttk.Entry): PCB 長度（mm）輸入框
     - p_h_entry (ttk.Entry): PCB 寬度（mm）輸入框
+    - _float_vars (dict): 上述四個數值輸入框綁定的 tk.DoubleVar（鍵為參數名稱）
     - p_origin_var (tk.StringVar): 座標原點下拉選單變數
     - confirm_button (tk.Button): 「確認」按鈕
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk
-from config import GlobalConfig
 from temperature_config_manager import TemperatureConfigManager
 
 
+# 溫度配置管理器快取：資料夾路徑 → (管理器, 載入時配置檔的 st_mtime_ns)
+# 重複開啟對話框時沿用同一個管理器，配置檔未被其他地方改寫時不再重新讀檔與解析。
+_TEMP_CFG_CACHE = {}
+_TEMP_CFG_CACHE_SIZE = 4
+
+
+def _temp_cfg_mtime(folder_path):
+    """回傳資料夾下 temperature_config.json 的 st_mtime_ns；無路徑或檔案不存在時回傳 None。"""
+    if not folder_path:
+        return None
+    try:
+        return os.stat(os.path.join(folder_path, "config", "temperature_config.json")).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_temp_cfg_mgr(folder_path):
+    """取得 folder_path 對應的溫度配置管理器（快取）。
+
+    配置檔的修改時間與快取時不同（例如主介面已寫入新的檔案路徑）時，
+    以 load_config() 重新載入，確保對話框儲存時不會以舊資料覆蓋檔案。
+    """
+    key = folder_path or None
+    cached = _TEMP_CFG_CACHE.pop(key, None)
+    mtime = _temp_cfg_mtime(key)
+    if cached is None:
+        manager = TemperatureConfigManager(key)
+    else:
+        manager = cached[0]
+        if mtime != cached[1]:
+            manager.load_config()
+            mtime = _temp_cfg_mtime(key)
+    # 重新插入到末端，超過上限時淘汰最久未使用的項目
+    _TEMP_CFG_CACHE[key] = (manager, mtime)
+    while len(_TEMP_CFG_CACHE) > _TEMP_CFG_CACHE_SIZE:
+        _TEMP_CFG_CACHE.pop(next(iter(_TEMP_CFG_CACHE)))
+    return manager
+
+
+# 取得溫度配置失敗時使用的預設參數
+_DEFAULT_PARAMS = {
+    "min_temp": 50.0, "max_temp": 80.0, "color": "绿色",
+    "max_ratio": 10.0, "auto_reduce": 1.0,
+    "p_w": 237.0, "p_h": 194.0, "p_origin": "左下",
+    "p_origin_offset_x": 0.0, "p_origin_offset_y": 0.0,
+    "c_padding_left": 0.0, "c_padding_top": 0.0, "c_padding_right": 0.0, "c_padding_bottom": 0.0
+}
+
+
+def _touch_temp_cfg_cache(folder_path):
+    """對話框自行儲存配置後，更新快取中記錄的修改時間，避免下次開啟時多餘的重新載入。"""
+    key = folder_path or None
+    cached = _TEMP_CFG_CACHE.get(key)
+    if cached is not None:
+        _TEMP_CFG_CACHE[key] = (cached[0], _temp_cfg_mtime(key))
+
+
 class TemplateDialog:
     """溫度過濾與 PCB 參數設定對話框。
 
@@ -45,8 +102,8 @@ class TemplateDialog:
         master (tk.Widget): 主視窗元件
         settings_button (tk.Button): 觸發本對話框的按鈕（用於定位）
         callback (callable): 確認後的回呼函式
-        config (GlobalConfig): 全域配置管理器
-        temp_config (TemperatureConfigManager): 溫度配置管理器
+        temp_config (TemperatureConfigManager): 溫度配置管理器（依資料夾路徑快取共用）
+        current_folder_path (str|None): 目前的資料夾路徑
         dialog_result (dict): 對話框結果字典
     """
 
@@ -62,69 +119,105 @@ class TemplateDialog:
         self.master = master
         self.settings_button = settings_button
         self.callback = callback  # 接收外部传入的回调函数
-        self.config = GlobalConfig()
-        
-        # 初始化温度配置管理器
-        print(f"初始化温度配置管理器，文件夹路径: {current_folder_path}")
+
+        self.current_folder_path = current_folder_path
+        self._load_temp_config()
+
+        self.dialog = None  # 對話框視窗，首次 open() 時建立，之後隱藏/重新顯示重複使用
+        self.dialog_result = {}
+        self._pending_flush = None     # 待寫入磁碟的 (溫度配置管理器, 資料夾路徑, 參數)
+        self._flush_scheduled = False  # 是否已排程寫入（連續觸發時只排程一次）
+
+    def set_folder_path(self, current_folder_path):
+        """切換資料夾路徑（主介面開啟其他資料夾後重用同一對話框時呼叫）。"""
+        if current_folder_path != self.current_folder_path:
+            self.current_folder_path = current_folder_path
+            self._load_temp_config()
+
+    def _load_temp_config(self):
+        """取得目前資料夾的溫度配置管理器（快取，配置檔被改寫時自動重新載入）。"""
+        print(f"初始化温度配置管理器，文件夹路径: {self.current_folder_path}")
         try:
-            if current_folder_path:
-                self.temp_config = TemperatureConfigManager(current_folder_path)
-                print("使用文件夹路径初始化配置管理器")
-            else:
-                # 如果没有文件夹路径，创建一个临时的配置管理器
-                self.temp_config = TemperatureConfigManager()
-                # 使用默认配置
-                self.temp_config.config_data = self.temp_config.default_config.copy()
-                print("使用默认配置初始化配置管理器")
+            # 同一資料夾沿用快取的管理器；沒有資料夾路徑時為使用預設配置的臨時管理器
+            self.temp_config = _get_temp_cfg_mgr(self.current_folder_path)
         except Exception as e:
             print(f"初始化温度配置管理器时出错: {e}")
             # 创建一个简单的配置对象
             self.temp_config = type('TempConfig', (), {
-                'get_all_parameters': lambda: {
-                    "min_temp": 50.0, "max_temp": 80.0, "color": "绿色",
-                    "max_ratio": 10.0, "auto_reduce": 1.0,
-                    "p_w": 237.0, "p_h": 194.0, "p_origin": "左下",
-                    "p_origin_offset_x": 0.0, "p_origin_offset_y": 0.0,
-                    "c_padding_left": 0.0, "c_padding_top": 0.0, "c_padding_right": 0.0, "c_padding_bottom": 0.0
-                },
+                'get_all_parameters': lambda: dict(_DEFAULT_PARAMS),
                 'get_file_info_display': lambda: "未加载文件",
                 'save_parameters': lambda x: None
             })()
-        
-        self.dialog_result = {}
 
-    def on_dialog_close(self):
-        """對話框關閉時的回呼。收集參數並儲存。"""
-        self.get_params()
-        self.config.update(self.dialog_result)
-        self.config.save_to_csv()
-        self.dialog.destroy()
+    def _schedule_flush(self):
+        """排程在 UI 空閒時寫入配置檔，避免磁碟 I/O 阻塞按鈕回呼。
+
+        排程執行前再次觸發時只更新待寫入的參數，不重複排程，多次儲存合併為一次寫檔。
+        """
+        self._pending_flush = (self.temp_config, self.current_folder_path, dict(self.dialog_result))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.master.after_idle(self._flush_config)
+
+    def _flush_config(self):
+        """實際寫入排程中的溫度配置參數。"""
+        self._flush_scheduled = False
+        pending, self._pending_flush = self._pending_flush, None
+        if pending is not None:
+            temp_config, folder_path, params = pending
+            temp_config.save_parameters(params)
+            _touch_temp_cfg_cache(folder_path)
+
+    def _hide_dialog(self):
+        """隱藏對話框（保留所有元件供下次開啟時重用）。"""
+        try:
+            self.dialog.grab_release()
+            self.dialog.withdraw()
+        except tk.TclError:
+            # 視窗已被銷毀，下次開啟時重新建立
+            self.dialog = None
 
     def open(self):
-        """開啟溫度過濾對話框，建立所有 UI 元件並顯示。"""
+        """開啟溫度過濾對話框。
+
+        首次開啟時建立所有 UI 元件；之後重用隱藏中的對話框，只重新填入參數並顯示。
+        """
+        # 主介面可能在開啟前改寫了配置檔，重新取得（未變動時直接回傳快取）
+        self._load_temp_config()
+        params = self._get_params_for_display()
+
+        if self.dialog is not None:
+            try:
+                if self.dialog.winfo_exists():
+                    self._fill_entries(params)
+                    self._place_dialog()
+                    self.dialog.deiconify()
+                    self.dialog.grab_set()
+                    self.dialog.lift()
+                    return
+            except tk.TclError:
+                pass
+            self.dialog = None
+
         print("開始建立溫度過濾對話框...")
         try:
-            # 创建新的对话框
-            dialog = tk.Toplevel(self.master)
-            dialog.title("温度过滤")
-            self.dialog = dialog
-            print("对话框创建成功")
+            self._build_once(params)
         except Exception as e:
             print(f"创建对话框时出错: {e}")
             import traceback
             traceback.print_exc()
             return
-         # 监听窗口关闭事件
-        # dialog.protocol("WM_DELETE_WINDOW", self.on_dialog_close)
 
-        # 获取温度过滤按钮的坐标，显示在按钮下方5px（与设置弹窗一致）
+        print("温度过滤对话框创建完成，应该已经显示")
+
+    def _place_dialog(self):
+        """將對話框定位在溫度過濾按鈕下方 5px（與設定彈窗一致）。"""
         x = self.settings_button.winfo_rootx()  # 按钮的 x 坐标
         y = self.settings_button.winfo_rooty() + self.settings_button.winfo_height() + 5  # 按钮下方5px
+        self.dialog.geometry(f"+{x}+{y}")
 
-        # 设置对话框的位置
-        dialog.geometry(f"+{x}+{y}")
-
-        # 从温度配置管理器获取参数
+    def _get_params_for_display(self):
+        """從溫度配置管理器取得要顯示的參數，失敗時回傳預設值。"""
         print("获取温度配置参数...")
         try:
             params = self.temp_config.get_all_parameters()
@@ -132,29 +225,48 @@ class TemplateDialog:
         except Exception as e:
             print(f"获取参数时出错: {e}")
             # 使用默认值
-            params = {
-                "min_temp": 50.0,
-                "max_temp": 80.0,
-                "color": "绿色",
-                "max_ratio": 10.0,
-                "auto_reduce": 1.0,
-                "p_w": 237.0,
-                "p_h": 194.0,
-                "p_origin": "左下",
-                "p_origin_offset_x": 0.0,
-                "p_origin_offset_y": 0.0,
-                "c_padding_left": 0.0,
-                "c_padding_top": 0.0,
-                "c_padding_right": 0.0,
-                "c_padding_bottom": 0.0
-            }
-        
-        min_temp_var = params["min_temp"]
-        max_temp_var = params["max_temp"]
+            params = dict(_DEFAULT_PARAMS)
+        return params
 
-        # PCB参数设置
-        p_w_var = str(params["p_w"])
-        p_h_var = str(params["p_h"])
+    def _fill_entries(self, params):
+        """將參數重新填入已建立的輸入框與下拉選單。"""
+        self._shown_params = params
+        for key, var in self._float_vars.items():
+            var.set(params[key])
+        self.p_origin_var.set(params["p_origin"])
+
+    @staticmethod
+    def _is_float(text):
+        """輸入框的 validatecommand：只允許可解析為浮點數的內容（以及輸入中的空字串、負號、小數點）。"""
+        if text in ("", "-", ".", "-."):
+            return True
+        try:
+            float(text)
+        except ValueError:
+            return False
+        return True
+
+    def _read_float(self, key):
+        """讀取數值輸入框對應的 DoubleVar；內容不完整（如空白或只有負號）時沿用開啟時的值。"""
+        try:
+            return self._float_vars[key].get()
+        except tk.TclError:
+            return float(self._shown_params.get(key, _DEFAULT_PARAMS[key]))
+
+    def _build_once(self, params):
+        """建立對話框與所有 UI 元件（僅在首次開啟或視窗被銷毀後呼叫）。"""
+        dialog = tk.Toplevel(self.master)
+        dialog.title("温度过滤")
+        self.dialog = dialog
+        # 监听窗口关闭事件：只隐藏，保留元件供下次开启重用
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_dialog)
+        self._place_dialog()
+
+        self._shown_params = params
+        # 數值輸入框皆以 DoubleVar 儲存，get_params 直接讀取浮點數
+        self._float_vars = {key: tk.DoubleVar(dialog, value=params[key])
+                            for key in ("min_temp", "max_temp", "p_w", "p_h")}
+        vcmd = (dialog.register(self._is_float), '%P')
         p_origin_var = params["p_origin"]
 
         # 创建主框架
@@ -172,13 +284,13 @@ class TemplateDialog:
         temp_range_frame.pack(fill=tk.X, padx=5, pady=5)
         
         ttk.Label(temp_range_frame, text="最低温度:").pack(side=tk.LEFT, padx=5)
-        self.min_temp_entry = ttk.Entry(temp_range_frame, width=10)
-        self.min_temp_entry.insert(0, str(min_temp_var))
+        self.min_temp_entry = ttk.Entry(temp_range_frame, width=10, textvariable=self._float_vars["min_temp"],
+                                  validate="key", validatecommand=vcmd)
         self.min_temp_entry.pack(side=tk.LEFT, padx=5)
         
         ttk.Label(temp_range_frame, text="最高温度:").pack(side=tk.LEFT, padx=5)
-        self.max_temp_entry = ttk.Entry(temp_range_frame, width=10)
-        self.max_temp_entry.insert(0, str(max_temp_var))
+        self.max_temp_entry = ttk.Entry(temp_range_frame, width=10, textvariable=self._float_vars["max_temp"],
+                                  validate="key", validatecommand=vcmd)
         self.max_temp_entry.pack(side=tk.LEFT, padx=5)
         
         # PCB参数设置
@@ -190,12 +302,12 @@ class TemplateDialog:
         size_frame.pack(fill=tk.X, padx=5, pady=2)
         
         ttk.Label(size_frame, text="PCB长度(mm):").pack(side=tk.LEFT, padx=5)
-        self.p_w_entry = ttk.Entry(size_frame, width=10)
-        self.p_w_entry.insert(0, str(p_w_var))
+        self.p_w_entry = ttk.Entry(size_frame, width=10, textvariable=self._float_vars["p_w"],
+                                  validate="key", validatecommand=vcmd)
         self.p_w_entry.pack(side=tk.LEFT, padx=5)
         ttk.Label(size_frame, text="PCB宽度(mm):").pack(side=tk.LEFT, padx=5)
-        self.p_h_entry = ttk.Entry(size_frame, width=10)
-        self.p_h_entry.insert(0, str(p_h_var))
+        self.p_h_entry = ttk.Entry(size_frame, width=10, textvariable=self._float_vars["p_h"],
+                                  validate="key", validatecommand=vcmd)
         self.p_h_entry.pack(side=tk.LEFT, padx=5)
         
         # 坐标原点
@@ -225,20 +337,6 @@ class TemplateDialog:
 
 
 
-        def on_confirm():
-            # 收集用户输入的参数
-            self.get_params()
-            
-            # 保存到温度配置管理器
-            self.temp_config.save_parameters(self.dialog_result)
-            
-            # 调用外部回调函数，并传递结果
-            if self.callback:
-                self.callback(self.dialog_result)
-
-            # 关闭对话框
-            dialog.destroy()
-
         # 提示標籤：雙擊熱力圖可開啟編輯介面
         hint_frame = tk.Frame(main_frame)
         hint_frame.pack(pady=(10, 0))
@@ -247,7 +345,7 @@ class TemplateDialog:
                  font=("Arial", 9), fg="#666666").pack(side=tk.LEFT)
 
         # 确认按钮
-        confirm_button = tk.Button(main_frame, text="  确认  ", command=on_confirm)
+        confirm_button = tk.Button(main_frame, text="  确认  ", command=self._on_confirm)
         confirm_button.pack(pady=10)
 
         # 设置对话框为模态，但不阻塞主线程
@@ -256,21 +354,34 @@ class TemplateDialog:
         
         # 不阻塞主线程，让对话框异步运行
         # dialog.wait_window(dialog)  # 移除这行，避免阻塞
-        
-        print("温度过滤对话框创建完成，应该已经显示")
+
+    def _on_confirm(self):
+        """「確認」按鈕的回呼：收集參數、儲存並透過 callback 傳遞結果，然後隱藏對話框。"""
+        # 收集用户输入的参数
+        self.get_params()
+
+        # 保存到温度配置管理器（空闲时写入磁碟）
+        self._schedule_flush()
+
+        # 调用外部回调函数，并传递结果
+        if self.callback:
+            self.callback(self.dialog_result)
+
+        # 隐藏对话框（保留元件供下次开启重用）
+        self._hide_dialog()
 
     def get_params(self):
         """從所有輸入框收集參數值並存入 dialog_result 字典。"""
         self.dialog_result = {
-            "min_temp": float(self.min_temp_entry.get()),
-            "max_temp": float(self.max_temp_entry.get()),
+            "min_temp": self._read_float("min_temp"),
+            "max_temp": self._read_float("max_temp"),
             "color": "绿色",  # 默认值
             # min_width 和 min_height 已移除（未實際使用）
             "max_ratio": 10.0,  # 默认值
             "auto_reduce": 1.0,  # 默认值
             # PCB参数
-            "p_w": float(self.p_w_entry.get()),
-            "p_h": float(self.p_h_entry.get()),
+            "p_w": self._read_float("p_w"),
+            "p_h": self._read_float("p_h"),
             "p_origin": self.p_origin_var.get(),
             # 使用默认值0，不再显示输入框
             "p_origin_offset_x": 0.0,
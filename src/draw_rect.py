@@ -27,14 +27,288 @@
 import cv2
 import numpy as np
 import tkinter as tk
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageTk
 import traceback
+from collections import namedtuple
+from functools import lru_cache
 from config import GlobalConfig
 from rotation_utils import get_rotated_corners, corners_to_flat
 
+# Numba 為選用相依套件：安裝時以編譯後的逐像素核心合成描邊文字，
+# 未安裝時退回 NumPy 整塊運算（結果相同，但會建立數個暫存陣列）。
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 OUTLINE_OFFSETS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
 
+# 標記座標欄位，依序組成 (N, 6) 座標陣列
+_COORD_KEYS = ("x1", "y1", "x2", "y2", "cx", "cy")
+
+# 標記樣式：框線/名稱/溫度顏色（#RRGGBB）、框線粗細、名稱與溫度字型大小
+_MarkStyle = namedtuple("_MarkStyle", "rect_color name_color temp_color rect_width name_font_size temp_font_size")
+
+
+@lru_cache(maxsize=4)
+def _resolve_style(image_index, cfg_version):
+    """從 GlobalConfig 讀取指定影像的標記樣式。
+
+    以 (image_index, cfg_version) 為快取鍵：配置未變更時同一影像的所有標記
+    共用同一份結果，設定對話框修改配置後版本號遞增，快取自動失效。
+
+    Args:
+        image_index (int): 0=熱力圖，1=Layout 圖
+        cfg_version (int): GlobalConfig.version
+
+    Returns:
+        _MarkStyle: 標記樣式
+    """
+    config = GlobalConfig()
+    if image_index == 0:
+        # 热力图标记
+        rect_color = config.get("heat_rect_color", "#BCBCBC")
+        name_color = config.get("heat_name_color", "#FFFFFF")
+        temp_color = config.get("heat_temp_color", "#FF0000")
+        rect_width = config.get("heat_rect_width", 2)
+    else:
+        # Layout图标记
+        rect_color = config.get("layout_rect_color", "#BCBCBC")
+        name_color = config.get("layout_name_color", "#FFFFFF")
+        temp_color = config.get("layout_temp_color", "#FF0000")
+        rect_width = config.get("layout_rect_width", 2)
+
+    # 两个canvas统一使用热力图的字体大小配置，确保文字大小完全一致
+    name_font_size = config.get("heat_name_font_size", 12)
+    temp_font_size = config.get("heat_temp_font_size", 10)
+    return _MarkStyle(rect_color, name_color, temp_color, rect_width, name_font_size, temp_font_size)
+
+
+@lru_cache(maxsize=64)
+def _hex_to_rgb(hex_color):
+    """將 "#RRGGBB" 轉為 (R, G, B)，供 PIL 繪製文字使用（顏色來自配置，幾乎總是命中快取）。"""
+    hex_color = hex_color.lstrip('#')
+    return (int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
+
+
+@lru_cache(maxsize=64)
+def _hex_to_bgr(hex_color):
+    """將 "#RRGGBB" 轉為 (B, G, R)，供 OpenCV 繪製圖形使用。"""
+    r, g, b = _hex_to_rgb(hex_color)
+    return (b, g, r)
+
+
+# 匯出影像文字使用的字型檔
+_FONT_PATH = "font/msyh.ttc"
+
+
+@lru_cache(maxsize=32)
+def _get_font(path, size):
+    """載入 TrueType 字型（依 (path, size) 快取，避免每次匯出都重新讀檔解析）。
+
+    字型檔無法讀取時退回 PIL 內建的預設字型。
+
+    Args:
+        path (str): 字型檔路徑
+        size (int): 字型大小（px）
+
+    Returns:
+        ImageFont.FreeTypeFont | ImageFont.ImageFont: 字型物件
+    """
+    try:
+        return ImageFont.truetype(path, size)
+    except IOError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=512)
+def _text_masks(text, size):
+    """預先光柵化匯出影像用的文字（依 (文字, 字型大小) 快取）。
+
+    同一元器件名稱、溫度值在重複匯出時只需排版、光柵化一次，之後直接以
+    遮罩貼上；顏色在貼上時才指定，因此不列入快取鍵。遮罩外圍預留 1px 給描邊。
+
+    Args:
+        text (str): 文字內容
+        size (int): 字型大小（px）
+
+    Returns:
+        tuple: (bbox, shadow_alpha, body_alpha)
+            bbox 為文字以左上角 (0, 0) 繪製時的邊界 (left, top, right, bottom)；
+            shadow_alpha 為 4 方向描邊的聯集，body_alpha 為文字本體（皆為 0~1 的 float32 陣列）
+    """
+    font = _get_font(_FONT_PATH, size)
+    bbox = font.getbbox(text)
+    mask_size = (bbox[2] - bbox[0] + 2, bbox[3] - bbox[1] + 2)
+    origin_x, origin_y = 1 - bbox[0], 1 - bbox[1]
+    shadow_mask = Image.new("L", mask_size, 0)
+    shadow_draw = ImageDraw.Draw(shadow_mask)
+    for odx, ody in OUTLINE_OFFSETS:
+        shadow_draw.text((origin_x + odx, origin_y + ody), text, font=font, fill=255)
+    body_mask = Image.new("L", mask_size, 0)
+    ImageDraw.Draw(body_mask).text((origin_x, origin_y), text, font=font, fill=255)
+    return (bbox,
+            np.asarray(shadow_mask, np.float32) / 255.0,
+            np.asarray(body_mask, np.float32) / 255.0)
+
+
+def _blit_text(image, x, y, masks, shadow_color, color):
+    """將 _text_masks() 的結果直接疊加到 BGR 影像上，(x, y) 與 PIL draw.text 的左上角座標相同。"""
+    bbox, shadow_alpha, body_alpha = masks
+    _composite_alpha(image, x + bbox[0] - 1, y + bbox[1] - 1, shadow_alpha, body_alpha, shadow_color, color)
+
+
+@lru_cache(maxsize=512)
+def _cv_text_masks(text, font_scale):
+    """以 cv2.putText 將文字光柵化一次，產生文字本體與 4 方向描邊的覆蓋率遮罩（依 (文字, 字型比例) 快取）。
+
+    描邊只是本體遮罩平移 1px 的結果，不必再呼叫 4 次 putText。
+    多次半透明疊加黑色等同於以 1 - Π(1 - a) 的覆蓋率疊加一次。
+
+    Args:
+        text (str): 文字內容
+        font_scale (float): cv2.FONT_HERSHEY_COMPLEX 的字型比例
+
+    Returns:
+        tuple: (origin_x, origin_y, shadow_alpha, body_alpha)
+            origin 為 putText 基準點（左下角）在遮罩中的位置；兩個遮罩皆為 0~1 的 float32 陣列
+    """
+    pad = 3  # 預留反鋸齒溢出與描邊偏移
+    (tw, th), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_COMPLEX, font_scale, 1)
+    body = np.zeros((th + baseline + 2 * pad, tw + 2 * pad), np.uint8)
+    cv2.putText(body, text, (pad, pad + th), cv2.FONT_HERSHEY_COMPLEX, font_scale, 255, 1, cv2.LINE_AA)
+    body_alpha = body.astype(np.float32) / 255.0
+    shadow_keep = np.ones_like(body_alpha)
+    for odx, ody in OUTLINE_OFFSETS:
+        shadow_keep *= 1.0 - np.roll(body_alpha, (ody, odx), axis=(0, 1))
+    return pad, pad + th, 1.0 - shadow_keep, body_alpha
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _composite_outlined_kernel(roi, shadow_alpha, body_alpha, shadow_color, color):
+        """逐像素先疊加描邊色、再疊加文字色（就地寫回 roi），不建立任何暫存陣列。"""
+        rows, cols = roi.shape[0], roi.shape[1]
+        for y in range(rows):
+            for x in range(cols):
+                sa = shadow_alpha[y, x]
+                ba = body_alpha[y, x]
+                if sa == 0.0 and ba == 0.0:
+                    continue
+                for c in range(roi.shape[2]):
+                    v = roi[y, x, c] * (1.0 - sa) + shadow_color[c] * sa
+                    v = v * (1.0 - ba) + color[c] * ba
+                    roi[y, x, c] = np.uint8(v + 0.5)
+
+
+def _blit_outlined_text(image, x, y, masks, shadow_color, color):
+    """將 _cv_text_masks() 的結果疊加到影像上，(x, y) 與 cv2.putText 的基準點相同。"""
+    origin_x, origin_y, shadow_alpha, body_alpha = masks
+    _composite_alpha(image, x - origin_x, y - origin_y, shadow_alpha, body_alpha, shadow_color, color)
+
+
+def _composite_alpha(image, x0, y0, shadow_alpha, body_alpha, shadow_color, color):
+    """以左上角 (x0, y0) 就地疊加描邊色與文字色（依覆蓋率遮罩混色），超出影像的部分自動裁切。"""
+    x1, y1 = x0 + body_alpha.shape[1], y0 + body_alpha.shape[0]
+    ix0, iy0 = max(x0, 0), max(y0, 0)
+    ix1, iy1 = min(x1, image.shape[1]), min(y1, image.shape[0])
+    if ix0 >= ix1 or iy0 >= iy1:
+        return
+    roi = image[iy0:iy1, ix0:ix1]
+    mask_slice = (slice(iy0 - y0, iy1 - y0), slice(ix0 - x0, ix1 - x0))
+    if NUMBA_AVAILABLE:
+        _composite_outlined_kernel(roi, shadow_alpha[mask_slice], body_alpha[mask_slice],
+                                   np.asarray(shadow_color, np.float32), np.asarray(color, np.float32))
+        return
+    shadow_a = shadow_alpha[mask_slice][..., None]
+    body_a = body_alpha[mask_slice][..., None]
+    out = roi * (1.0 - shadow_a) + np.asarray(shadow_color, np.float32) * shadow_a
+    out = out * (1.0 - body_a) + np.asarray(color, np.float32) * body_a
+    roi[:] = np.rint(out).astype(np.uint8)
+
+
+def _compute_geometry(scaled, half, img_width, img_height, layout_mode):
+    """一次計算所有標記的矩形框頂點與三角形是否完整落在影像內（向量化）。
+
+    Args:
+        scaled (numpy.ndarray): (N, 6) 已縮放的 (left, top, right, bottom, cx, cy)
+        half (float): 三角形半邊長
+        img_width (int): 影像寬度
+        img_height (int): 影像高度
+        layout_mode (bool): 是否為 Layout 圖（僅 Layout 圖需檢查三角形邊界）
+
+    Returns:
+        tuple: (rect_pts, tri_ok)
+            rect_pts 為 (N, 4, 2) int32 矩形頂點（左上、右上、右下、左下），可直接交給 polylines；
+            tri_ok 為 (N,) bool，False 表示三角形超出 Layout 圖邊界
+    """
+    left, top, right, bottom, cx, cy = scaled.T
+    rect_pts = np.empty((len(scaled), 4, 2), np.int32)
+    rect_pts[:, 0, 0] = left
+    rect_pts[:, 0, 1] = top
+    rect_pts[:, 1, 0] = right
+    rect_pts[:, 1, 1] = top
+    rect_pts[:, 2, 0] = right
+    rect_pts[:, 2, 1] = bottom
+    rect_pts[:, 3, 0] = left
+    rect_pts[:, 3, 1] = bottom
+    if layout_mode:
+        tri_ok = ((cx - half >= 0) & (cx + half < img_width) &
+                  (cy - half >= 0) & (cy + half < img_height))
+    else:
+        tri_ok = np.ones(len(scaled), bool)
+    return rect_pts, tri_ok
+
+
+@lru_cache(maxsize=8)
+def _triangle_masks(half):
+    """預先光柵化匯出影像用的溫度三角形（含 4 方向黑色描邊）。
+
+    所有三角形形狀相同、只有位置不同，因此只需以 fillPoly 畫一次範本，
+    之後每個標記以布林遮罩直接寫入像素即可。範本以三角形中心為
+    (half + 1, half + 1)，外圍預留 1px 給描邊。
+
+    Args:
+        half (int): 三角形半邊長（即 size // 2）
+
+    Returns:
+        tuple: (shadow_mask, body_mask) 兩個 (2*half+3, 2*half+3) 的布林陣列
+    """
+    c = half + 1
+    template = np.zeros((2 * half + 3, 2 * half + 3), np.uint8)
+    tri = np.array(((c, c - half), (c - half, c + half), (c + half, c + half)), np.int32)
+    for odx, ody in OUTLINE_OFFSETS:
+        cv2.fillPoly(template, [(tri + (odx, ody)).reshape((-1, 1, 2))], 1)
+    cv2.fillPoly(template, [tri.reshape((-1, 1, 2))], 2)
+    return template == 1, template == 2
+
+
+def _blit_triangle(image, cx, cy, half, shadow_color, color):
+    """以預先光柵化的遮罩在 (cx, cy) 繪製溫度三角形，超出影像的部分自動裁切。"""
+    shadow_mask, body_mask = _triangle_masks(half)
+    x0, y0 = cx - half - 1, cy - half - 1
+    x1, y1 = x0 + shadow_mask.shape[1], y0 + shadow_mask.shape[0]
+    ix0, iy0 = max(x0, 0), max(y0, 0)
+    ix1, iy1 = min(x1, image.shape[1]), min(y1, image.shape[0])
+    if ix0 >= ix1 or iy0 >= iy1:
+        return
+    roi = image[iy0:iy1, ix0:ix1]
+    mask_slice = (slice(iy0 - y0, iy1 - y0), slice(ix0 - x0, ix1 - x0))
+    roi[shadow_mask[mask_slice]] = shadow_color
+    roi[body_mask[mask_slice]] = color
+
+
+def _frame_line_type(rect_width, text_scale):
+    """框線的 OpenCV 線型：1px 細線且影像寬度小於 1024 時反鋸齒幾乎看不出差異，改用較快的 LINE_8。"""
+    return cv2.LINE_8 if rect_width <= 1 and text_scale < 1.0 else cv2.LINE_AA
+
+
+def _mark_style(imageIndex):
+    """取得目前配置下指定影像的標記樣式（imageIndex 非 0 皆視為 Layout 圖）。"""
+    return _resolve_style(0 if imageIndex == 0 else 1, GlobalConfig().version)
+
 def calc_name_text_position(direction, left, top, right, bottom, angle, shape, scale, gap=3):
     """根據方向計算名稱文字位置（相對於框線邊界）。
 
@@ -117,6 +391,19 @@ def calc_name_position_for_rotated(corners, scale, gap=3):
     name_y = min_y - gap * scale
     return name_center_x, name_y
 
+# Tk 字型行高快取：字型描述 → linespace（px）
+_LINESPACE_CACHE = {}
+
+
+def _font_linespace(canvas, font):
+    """取得 Tk 字型的行高（單行文字在 Canvas 上的高度），依字型描述快取。"""
+    linespace = _LINESPACE_CACHE.get(font)
+    if linespace is None:
+        linespace = int(canvas.tk.call("font", "metrics", font, "-linespace"))
+        _LINESPACE_CACHE[font] = linespace
+    return linespace
+
+
 def _create_outline_texts(canvas, x, y, text, font, anchor="center", color="#000000"):
     """建立 4 個偏移黑色文字，形成描邊效果。回傳 outline_ids 列表。"""
     ids = []
@@ -136,6 +423,14 @@ def _create_outline_triangles(canvas, point1, point2, point3, color="#000000"):
         ids.append(oid)
     return ids
 
+# 溫度文字方向代碼 → (x, y) 偏移方向符號
+_DIR_SIGNS = {
+    "TL": (-1, -1), "T": (0, -1), "TR": (1, -1),
+    "L":  (-1, 0),                "R":  (1, 0),
+    "BL": (-1, 1),  "B": (0, 1),  "BR": (1, 1),
+}
+
+
 def calc_temp_text_offset(direction, tri_half, temp_w, temp_h, gap=0):
     """根據方向計算溫度文字中心相對於三角形中心的偏移量 (dx, dy)。
 
@@ -149,14 +444,8 @@ def calc_temp_text_offset(direction, tri_half, temp_w, temp_h, gap=0):
     Returns:
         tuple: (dx, dy) 偏移量
     """
-    x_off = tri_half + gap + temp_w / 2
-    y_off = tri_half + gap + temp_h / 2
-    offsets = {
-        "TL": (-x_off, -y_off), "T": (0, -y_off), "TR": (x_off, -y_off),
-        "L":  (-x_off, 0),                         "R":  (x_off, 0),
-        "BL": (-x_off, y_off),  "B": (0, y_off),   "BR": (x_off, y_off),
-    }
-    return offsets.get(direction, (0, -y_off))  # 預設正上方
+    sx, sy = _DIR_SIGNS.get(direction, (0, -1))  # 預設正上方
+    return sx * (tri_half + gap + temp_w / 2), sy * (tri_half + gap + temp_h / 2)
 
 def draw_triangle_and_text(imageA, item, imageScale = 1, imageIndex = 0, size=8):
     """在影像上繪製三角形溫度標記和文字。
@@ -177,33 +466,13 @@ def draw_triangle_and_text(imageA, item, imageScale = 1, imageIndex = 0, size=8)
     textScale = imgWidth / 1024
     size = size * textScale
 
-    # 从配置中读取颜色
-    config = GlobalConfig()
-    if imageIndex == 0:
-        # 热力图标记
-        rect_color_hex = config.get("heat_rect_color", "#BCBCBC")
-        name_color_hex = config.get("heat_name_color", "#FFFFFF")
-        temp_color_hex = config.get("heat_temp_color", "#FF0000")
-        rectWidth = config.get("heat_rect_width", 2)
-    else:
-        # Layout图标记
-        rect_color_hex = config.get("layout_rect_color", "#BCBCBC")
-        name_color_hex = config.get("layout_name_color", "#FFFFFF")
-        temp_color_hex = config.get("layout_temp_color", "#FF0000")
-        rectWidth = config.get("layout_rect_width", 2)
-
-    # 两个canvas统一使用热力图的字体大小配置，确保文字大小完全一致
-    name_font_size = config.get("heat_name_font_size", 12)
-    temp_font_size = config.get("heat_temp_font_size", 10)
+    # 从配置中读取颜色（同一配置版本下所有标记共用一份）
+    rect_color_hex, name_color_hex, temp_color_hex, rectWidth, name_font_size, temp_font_size = _mark_style(imageIndex)
 
     # 转换十六进制颜色为RGB元组
-    def hex_to_rgb(hex_color):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
-    rectColor = hex_to_rgb(rect_color_hex)
-    textColor = hex_to_rgb(name_color_hex)
-    tempColor = hex_to_rgb(temp_color_hex)
+    rectColor = _hex_to_rgb(rect_color_hex)
+    textColor = _hex_to_rgb(name_color_hex)
+    tempColor = _hex_to_rgb(temp_color_hex)
     shadowColor = (0, 0, 0)
 
     left, top, right, bottom, cx, cy, max_temp, name = item.get("x1"), item.get("y1"), item.get("x2"), item.get("y2"), item.get("cx"), item.get("cy"), item.get("max_temp"), item.get("name")
@@ -217,12 +486,13 @@ def draw_triangle_and_text(imageA, item, imageScale = 1, imageIndex = 0, size=8)
     # 繪製框（支援圓形和旋轉）
     shape = item.get("shape", "rectangle")
     angle = item.get("angle", 0)
+    line_type = _frame_line_type(rectWidth, textScale)
     if shape == "circle":
         center_x = int((left + right) / 2)
         center_y = int((top + bottom) / 2)
         axis_x = int((right - left) / 2)
         axis_y = int((bottom - top) / 2)
-        cv2.ellipse(imageA, (center_x, center_y), (axis_x, axis_y), 0, 0, 360, rectColor, rectWidth, cv2.LINE_AA)
+        cv2.ellipse(imageA, (center_x, center_y), (axis_x, axis_y), 0, 0, 360, rectColor, rectWidth, line_type)
     elif angle != 0:
         geo_cx = (left + right) / 2
         geo_cy = (top + bottom) / 2
@@ -230,34 +500,12 @@ def draw_triangle_and_text(imageA, item, imageScale = 1, imageIndex = 0, size=8)
         half_h = (bottom - top) / 2
         corners = get_rotated_corners(geo_cx, geo_cy, half_w, half_h, angle)
         pts = np.array(corners, np.int32).reshape((-1, 1, 2))
-        cv2.polylines(imageA, [pts], isClosed=True, color=rectColor, thickness=rectWidth, lineType=cv2.LINE_AA)
+        cv2.polylines(imageA, [pts], isClosed=True, color=rectColor, thickness=rectWidth, lineType=line_type)
     else:
-        cv2.rectangle(imageA, (left, top), (right, bottom), rectColor, rectWidth, cv2.LINE_AA)
-    # 计算三角形的三个顶点
-    center = (cx, cy)
-    # 顶点1 (尖角)
-    point1 = (center[0], center[1] - size // 2)
-    # 顶点2 (左下角)
-    point2 = (center[0] - size // 2, center[1] + size // 2)
-    # 顶点3 (右下角)
-    point3 = (center[0] + size // 2, center[1] + size // 2)
-    
-    # 将顶点连接成一个三角形
-    pts = np.array([point1, point2, point3], np.int32)
-    pts = pts.reshape((-1, 1, 2))
-
-    # 三角形 4 方向描邊
-    for odx, ody in OUTLINE_OFFSETS:
-        outline_pts = np.array([
-            (point1[0] + odx, point1[1] + ody),
-            (point2[0] + odx, point2[1] + ody),
-            (point3[0] + odx, point3[1] + ody)
-        ], np.int32).reshape((-1, 1, 2))
-        cv2.fillPoly(imageA, [outline_pts], color=shadowColor)
-    # 绘制三角形
-    cv2.fillPoly(imageA, [pts], color=tempColor)
+        cv2.rectangle(imageA, (left, top), (right, bottom), rectColor, rectWidth, line_type)
+    # 三角形（尖角朝上）4 方向描邊 + 本体：套用预先光栅化的遮罩，不再逐次建立顶点数组与 fillPoly
+    _blit_triangle(imageA, cx, cy, int(size // 2), shadowColor, tempColor)
 
-        
     # 使用配置的字体大小
     name_font_scale = (name_font_size / 12.0) * 0.55 * textScale
     temp_font_scale = (temp_font_size / 10.0) * 0.55 * textScale
@@ -272,9 +520,7 @@ def draw_triangle_and_text(imageA, item, imageScale = 1, imageIndex = 0, size=8)
     name_tl_x, name_tl_y = _anchor_to_topleft(name_x, name_y_anchor, ntw, nth, name_anchor)
     # cv2 putText origin is bottom-left
     name_pos = (int(name_tl_x), int(name_tl_y + nth))
-    for odx, ody in OUTLINE_OFFSETS:
-        cv2.putText(imageA, f'{name}', (name_pos[0] + odx, name_pos[1] + ody), cv2.FONT_HERSHEY_COMPLEX, name_font_scale, shadowColor, 1, cv2.LINE_AA)
-    cv2.putText(imageA, f'{name}', name_pos, cv2.FONT_HERSHEY_COMPLEX, name_font_scale, textColor, 1, cv2.LINE_AA)
+    _blit_outlined_text(imageA, name_pos[0], name_pos[1], _cv_text_masks(f'{name}', name_font_scale), shadowColor, textColor)
 
     # 根據方向計算溫度文字偏移
     direction = item.get("temp_text_dir", "T")
@@ -287,12 +533,8 @@ def draw_triangle_and_text(imageA, item, imageScale = 1, imageIndex = 0, size=8)
     temp_x = int(cx + dx - tw / 2)
     temp_y = int(cy + dy + th / 2)
 
-    # 溫度文字 4 方向描邊
-    for odx, ody in OUTLINE_OFFSETS:
-        cv2.putText(imageA, temp_text, (temp_x + odx, temp_y + ody), cv2.FONT_HERSHEY_COMPLEX, temp_font_scale, shadowColor, 1, cv2.LINE_AA)
-    cv2.putText(imageA, temp_text, (temp_x, temp_y), cv2.FONT_HERSHEY_COMPLEX, temp_font_scale, tempColor, 1, cv2.LINE_AA)
-
-    print("draw_triangle_and_text------->>> ", point1, point2, point3, cx, cy)
+    # 溫度文字 4 方向描邊 + 本体（文字只光栅化一次）
+    _blit_outlined_text(imageA, temp_x, temp_y, _cv_text_masks(temp_text, temp_font_scale), shadowColor, tempColor)
 
 
 def draw_canvas_item(canvas, item, imageScale=1, offset=(0, 0), imageIndex=0, size=8, font_scale=None, clip_bounds=None):
@@ -332,13 +574,14 @@ def draw_canvas_item(canvas, item, imageScale=1, offset=(0, 0), imageIndex=0, si
         print(f"错误：imageScale为None")
         raise ValueError(f"imageScale不能为None")
 
+    # 四捨五入取整（int() 向零截斷，負座標時偏移方向相反，縮放/平移時會左右跳動 1px）
     off_x, off_y = offset
-    left = int(left * imageScale) + off_x
-    top = int(top * imageScale) + off_y
-    right = int(right * imageScale) + off_x
-    bottom = int(bottom * imageScale) + off_y
-    cx = int(cx * imageScale) + off_x
-    cy = int(cy * imageScale) + off_y
+    left = round(left * imageScale) + off_x
+    top = round(top * imageScale) + off_y
+    right = round(right * imageScale) + off_x
+    bottom = round(bottom * imageScale) + off_y
+    cx = round(cx * imageScale) + off_x
+    cy = round(cy * imageScale) + off_y
 
     # clip_bounds 裁切：框線最多畫到圖片邊界，完全在圖外的元器件跳過
     if clip_bounds is not None:
@@ -365,24 +608,19 @@ def draw_canvas_item(canvas, item, imageScale=1, offset=(0, 0), imageIndex=0, si
     # 🔥 三角形大小：與字體一樣，使用 font_scale 控制
     size = max(7, int(size * font_scale))
 
-    # 从配置中读取颜色
-    config = GlobalConfig()
-    if imageIndex == 0:
-        # 热力图标记
-        rectColor = config.get("heat_rect_color", "#BCBCBC")
-        textColor = config.get("heat_name_color", "#FFFFFF")
-        tempColor = config.get("heat_temp_color", "#FF0000")
-        rectWidth = config.get("heat_rect_width", 2)
-    else:
-        # Layout图标记
-        rectColor = config.get("layout_rect_color", "#BCBCBC")
-        textColor = config.get("layout_name_color", "#FFFFFF")
-        tempColor = config.get("layout_temp_color", "#FF0000")
-        rectWidth = config.get("layout_rect_width", 2)
-
-    # 两个canvas统一使用热力图的字体大小配置，确保文字大小完全一致
-    name_font_size = config.get("heat_name_font_size", 12)
-    temp_font_size = config.get("heat_temp_font_size", 10)
+    # 从配置中读取颜色（同一配置版本下所有标记共用一份）
+    rectColor, textColor, tempColor, rectWidth, name_font_size, temp_font_size = _mark_style(imageIndex)
+
+    # 完全在可视区域外（含名称、温度文字可能延伸的范围）的标记不建立任何 Canvas 物件，
+    # 省下 Tcl 往返；Canvas 尚未完成布局时（宽高为 1）不做此判断
+    if canvas_width > 1 and canvas_height > 1:
+        margin = int(max(name_font_size, temp_font_size) * font_scale) * (len(f'{name}') + 2) + size
+        if (right + margin < 0 or bottom + margin < 0 or
+                left - margin >= canvas_width or top - margin >= canvas_height):
+            item["tempOutlineIds"] = []
+            item["nameOutlineIds"] = []
+            item["triangleOutlineIds"] = []
+            return None, None, None, None
 
     shadowColor = "#000000"  # 黑色
 
@@ -423,32 +661,20 @@ def draw_canvas_item(canvas, item, imageScale=1, offset=(0, 0), imageIndex=0, si
     # 使用配置的字体大小
     name_font_size_scaled = int(name_font_size * font_scale)
     temp_font_size_scaled = int(temp_font_size * font_scale)
-    print(f"draw_canvas_item: name_font={name_font_size}*{font_scale:.2f}={name_font_size_scaled}, temp_font={temp_font_size}*{font_scale:.2f}={temp_font_size_scaled}")
 
-    # 先建立溫度描邊文字（在主文字下方），再建立主文字
+    # 先以字型度量算出溫度文字的最終位置，再直接在該處建立描邊與主文字，
+    # 不必先建立、以 bbox 量測後再逐一 coords 移動
+    temp_text = f'{max_temp}'
     temp_font_tuple = ("Arial", temp_font_size_scaled)
-    tempOutlineIds = _create_outline_texts(canvas, cx, cy, f'{max_temp}', temp_font_tuple)
-    tempTextId = canvas.create_text(cx, cy, text=f'{max_temp}',
-                       font=temp_font_tuple, fill=tempColor, anchor="center")
-
-    # 根據方向計算溫度文字偏移
     direction = item.get("temp_text_dir", "T")
-    temp_bbox = canvas.bbox(tempTextId)
-    if temp_bbox:
-        temp_w = temp_bbox[2] - temp_bbox[0]
-        temp_h = temp_bbox[3] - temp_bbox[1]
-        tri_half = size / 2
-        gap = max(3, int(7 * font_scale))
-        dx, dy = calc_temp_text_offset(direction, tri_half, temp_w, temp_h, gap=gap)
-        canvas.coords(tempTextId, cx + dx, cy + dy)
-        # 同步移動描邊文字
-        for oid, (odx, ody) in zip(tempOutlineIds, OUTLINE_OFFSETS):
-            canvas.coords(oid, cx + dx + odx, cy + dy + ody)
-    else:
-        # fallback: 預設正上方
-        canvas.coords(tempTextId, cx, cy - 16 * imageScale)
-        for oid, (odx, ody) in zip(tempOutlineIds, OUTLINE_OFFSETS):
-            canvas.coords(oid, cx + odx, cy - 16 * imageScale + ody)
+    temp_w = int(canvas.tk.call("font", "measure", temp_font_tuple, temp_text))
+    temp_h = _font_linespace(canvas, temp_font_tuple)
+    tri_half = size / 2
+    gap = max(3, int(7 * font_scale))
+    dx, dy = calc_temp_text_offset(direction, tri_half, temp_w, temp_h, gap=gap)
+    tempOutlineIds = _create_outline_texts(canvas, cx + dx, cy + dy, temp_text, temp_font_tuple)
+    tempTextId = canvas.create_text(cx + dx, cy + dy, text=temp_text,
+                       font=temp_font_tuple, fill=tempColor, anchor="center")
 
     # 名称文字：根據 name_text_dir 定位到框線 8 方向
     name_text_dir = item.get("name_text_dir", "T")
@@ -466,6 +692,9 @@ def draw_canvas_item(canvas, item, imageScale=1, offset=(0, 0), imageIndex=0, si
     item["tempOutlineIds"] = tempOutlineIds
     item["nameOutlineIds"] = nameOutlineIds
     item["triangleOutlineIds"] = triangleOutlineIds
+    # 文字已以本次設定的字型重新建立，清除 update_canvas_item 記錄的縮放比例，
+    # 確保下次更新時一定會重新設定字體
+    item.pop("_canvas_font_scale", None)
 
     return rectId, triangleId, tempTextId, nameId
 
@@ -487,12 +716,12 @@ def update_canvas_item(canvas, item, imageScale=1):
     canvas_width = canvas.winfo_width()
     canvas_height = canvas.winfo_height()
 
-    x1 = int(x1 * imageScale)
-    y1 = int(y1 * imageScale)
-    x2 = min(canvas_width, int(x2 * imageScale))
-    y2 = min(canvas_height, int(y2 * imageScale)) 
-    cx = int(cx * imageScale)
-    cy = int(cy * imageScale)
+    x1 = round(x1 * imageScale)
+    y1 = round(y1 * imageScale)
+    x2 = min(canvas_width, round(x2 * imageScale))
+    y2 = min(canvas_height, round(y2 * imageScale))
+    cx = round(cx * imageScale)
+    cy = round(cy * imageScale)
     size = 8  # 假设三角形大小为 100
     font_scale = max(0.7, imageScale)
     size = max(7, int(size * imageScale))
@@ -500,6 +729,10 @@ def update_canvas_item(canvas, item, imageScale=1):
     # if(canvas_width < x2):
     # print("uuuuu -> ", x2, y2, imageScale)
 
+    # 所有 coords/itemconfig 累積成 Tcl 指令，每個階段以一次 tk.eval 送出，減少 Python↔Tcl 往返
+    w = canvas._w
+    cmds = []
+
     # 更新矩形框座標（支援旋轉 polygon）
     angle = item.get("angle", 0)
     if angle != 0:
@@ -509,9 +742,9 @@ def update_canvas_item(canvas, item, imageScale=1):
         half_h_u = (y2 - y1) / 2
         corners_u = get_rotated_corners(geo_cx_u, geo_cy_u, half_w_u, half_h_u, angle)
         flat_u = corners_to_flat(corners_u)
-        canvas.coords(rectId, *flat_u)
+        cmds.append(f"{w} coords {rectId} {' '.join(map(str, flat_u))}")
     else:
-        canvas.coords(rectId, x1, y1, x2, y2)
+        cmds.append(f"{w} coords {rectId} {x1} {y1} {x2} {y2}")
 
     # 名称文字：根據 name_text_dir 定位到框線 8 方向
     name_text_dir = item.get("name_text_dir", "T")
@@ -519,11 +752,17 @@ def update_canvas_item(canvas, item, imageScale=1):
         name_text_dir, x1, y1, x2, y2,
         angle, item.get("shape", "rectangle"), imageScale
     )
-    canvas.coords(nameId, name_x, name_y_pos)
-    canvas.itemconfig(nameId, font=("Arial", int(28 * font_scale), "bold"), anchor=name_anchor)
+    cmds.append(f"{w} coords {nameId} {name_x} {name_y_pos}")
+    cmds.append(f"{w} itemconfigure {nameId} -anchor {name_anchor}")
 
-    # 根據方向計算溫度文字偏移
-    canvas.itemconfig(tempTextId, font=("Arial", int(14 * font_scale)))
+    # 字體大小只在縮放比例改變時才更新（上次的值記錄在 item 中）
+    if item.get("_canvas_font_scale") != font_scale:
+        item["_canvas_font_scale"] = font_scale
+        cmds.append(f"{w} itemconfigure {nameId} -font {{Arial {int(28 * font_scale)} bold}}")
+        cmds.append(f"{w} itemconfigure {tempTextId} -font {{Arial {int(14 * font_scale)}}}")
+    canvas.tk.eval("\n".join(cmds))
+
+    # 根據方向計算溫度文字偏移（需在字體更新後量測 bbox）
     direction = item.get("temp_text_dir", "T")
     temp_bbox = canvas.bbox(tempTextId)
     if temp_bbox:
@@ -532,15 +771,18 @@ def update_canvas_item(canvas, item, imageScale=1):
         tri_half = size / 2
         gap = max(3, int(7 * imageScale))
         dx, dy = calc_temp_text_offset(direction, tri_half, temp_w, temp_h, gap=gap)
-        canvas.coords(tempTextId, cx + dx, cy + dy)
+        temp_pos = (cx + dx, cy + dy)
     else:
-        canvas.coords(tempTextId, cx, cy - 16 * imageScale)
+        temp_pos = (cx, cy - 16 * imageScale)
 
     # 计算新的三角形三个顶点
     point1 = (cx, cy - size // 2)  # 顶点1 (尖角)
     point2 = (cx - size // 2, cy + size // 2)  # 顶点2 (左下角)
     point3 = (cx + size // 2, cy + size // 2)  # 顶点3 (右下角)
-    canvas.coords(triangleId, point1, point2, point3)
+    canvas.tk.eval(
+        f"{w} coords {tempTextId} {temp_pos[0]} {temp_pos[1]}\n"
+        f"{w} coords {triangleId} {point1[0]} {point1[1]} {point2[0]} {point2[1]} {point3[0]} {point3[1]}"
+    )
 
 
 def draw_points_on_canvas(canvas, points, radius_red=8, ring_width=2, scale_factor=1):
@@ -552,53 +794,64 @@ def draw_points_on_canvas(canvas, points, radius_red=8, ring_width=2, scale_fact
     - radius_red: 内圆半径。
     - ring_width: 外圆宽度。
     - scale_factor: 缩放系数，默认为 8，用于提高绘制精度。
-    """
-    # 获取 Canvas 的宽高
-    canvas_width = canvas.winfo_width()
-    canvas_height = canvas.winfo_height()
 
+    返回:
+    - 叠加图的 Canvas 物件 ID；points 为空时返回 None。
+    """
     # 增加绘制精度（类似于原始图像的缩放）
     radius_red_resized = int(radius_red * scale_factor)
     ring_width_resized = int(ring_width * scale_factor)
-
-    index = 0
-    for point in points:
-        index += 1
-        # 计算缩放后的点位置
-        point_resized = (int(point[0] * scale_factor), int(point[1] * scale_factor))
-
-        # 绘制外圆（白色圆环）
-        canvas.create_oval(
-            point_resized[0] - radius_red_resized - ring_width_resized,  # 左上角 x 坐标
-            point_resized[1] - radius_red_resized - ring_width_resized,  # 左上角 y 坐标
-            point_resized[0] + radius_red_resized + ring_width_resized,  # 右下角 x 坐标
-            point_resized[1] + radius_red_resized + ring_width_resized,  # 右下角 y 坐标
-            fill="white",  # 填充白色
-            outline="white"  # 边框颜色为白色
-        )
-
-        # 绘制内圆（红色圆）
-        canvas.create_oval(
-            point_resized[0] - radius_red_resized,  # 左上角 x 坐标
-            point_resized[1] - radius_red_resized,  # 左上角 y 坐标
-            point_resized[0] + radius_red_resized,  # 右下角 x 坐标
-            point_resized[1] + radius_red_resized,  # 右下角 y 坐标
-            fill="red",  # 填充红色
-            outline="red"  # 边框颜色为红色
-        )
-
-        # 绘制文本
-        if index:
-            canvas.create_text(
-                point_resized[0],  # x 坐标偏移
-                point_resized[1],  # y 坐标偏移
-                text=str(index),  # 显示的文本为点的索引
-                font=("Arial", 12),  # 设置字体和大小
-                fill="white"  # 文本颜色为白色
-            )
+    outer_r = radius_red_resized + ring_width_resized
+
+    if not points:
+        return None
+
+    # 计算缩放后的点位置，以及涵盖所有圆圈的最小区域
+    pts = [(int(point[0] * scale_factor), int(point[1] * scale_factor)) for point in points]
+    x0 = min(x for x, _ in pts) - outer_r
+    y0 = min(y for _, y in pts) - outer_r
+    width = max(x for x, _ in pts) + outer_r - x0 + 1
+    height = max(y for _, y in pts) + outer_r - y0 + 1
+
+    # 所有圆圈与编号先画在一张透明 RGBA 图上，再以一次 create_image 贴到 Canvas，
+    # 取代每个点 3 次的 create_oval/create_text Tcl 调用
+    overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    font = _get_font(_FONT_PATH, 16)
+    for index, (px, py) in enumerate(pts, start=1):
+        px -= x0
+        py -= y0
+        # 外圆（白色圆环）
+        draw.ellipse((px - outer_r, py - outer_r, px + outer_r, py + outer_r), fill="white", outline="white")
+        # 内圆（红色圆）
+        draw.ellipse((px - radius_red_resized, py - radius_red_resized,
+                      px + radius_red_resized, py + radius_red_resized), fill="red", outline="red")
+        # 编号文本（白色，置中）
+        draw.text((px, py), str(index), font=font, fill="white", anchor="mm")
+
+    photo = ImageTk.PhotoImage(overlay)
+    # Canvas 不会持有 PhotoImage 的引用，须自行保存以免被回收；
+    # 以物件 ID 为键保存，多次调用的叠加图可并存，并顺带释放已被删除物件的引用
+    overlays = getattr(canvas, "_points_overlays", None)
+    if overlays is None:
+        overlays = canvas._points_overlays = {}
+    for stale_id in [i for i in overlays if not canvas.type(i)]:
+        del overlays[stale_id]
+    overlay_id = canvas.create_image(x0, y0, anchor="nw", image=photo)
+    overlays[overlay_id] = photo
+    return overlay_id
+
+
+def mark_coords_array(mark_rect_A):
+    """將標記列表的座標欄位組成 (N, 6) float64 陣列（欄位順序同 _COORD_KEYS）。
+
+    同一組標記需重複匯出（例如同時輸出圖片與報告）時，呼叫端可先建立一次，
+    再以 coords 參數傳入 draw_numpy_image_item，省去每次逐一讀取字典。
+    """
+    return np.array([[item.get(k) for k in _COORD_KEYS] for item in mark_rect_A], dtype=np.float64)
 
 
-def draw_numpy_image_item(imageA, mark_rect_A, imageScale=1, imageIndex=0, size=8):
+def draw_numpy_image_item(imageA, mark_rect_A, imageScale=1, imageIndex=0, size=8, coords=None):
     """在 NumPy 影像上繪製所有元器件標記（用於匯出影像）。
 
     遍歷 mark_rect_A 列表，為每個元器件繪製矩形框、名稱文字、
@@ -610,165 +863,109 @@ def draw_numpy_image_item(imageA, mark_rect_A, imageScale=1, imageIndex=0, size=
         imageScale (float): 縮放比例
         imageIndex (int): 影像索引（0=熱力圖，1=Layout 圖）
         size (int): 三角形標記邊長
+        coords (numpy.ndarray|None): 預先組好的 (N, 6) 座標陣列，欄位順序同 _COORD_KEYS，
+            列順序須與 mark_rect_A 一致；None 時從 mark_rect_A 的字典逐一讀取
     """
     imgWidth = imageA.shape[1]
     textScale = imgWidth / 1024
     size = size * textScale
 
-    # 从配置中读取颜色
-    config = GlobalConfig()
-    if imageIndex == 0:
-        # 热力图标记
-        rect_color_hex = config.get("heat_rect_color", "#BCBCBC")
-        name_color_hex = config.get("heat_name_color", "#FFFFFF")
-        temp_color_hex = config.get("heat_temp_color", "#FF0000")
-        rectWidth = config.get("heat_rect_width", 2)
-    else:
-        # Layout图标记
-        rect_color_hex = config.get("layout_rect_color", "#BCBCBC")
-        name_color_hex = config.get("layout_name_color", "#FFFFFF")
-        temp_color_hex = config.get("layout_temp_color", "#FF0000")
-        rectWidth = config.get("layout_rect_width", 2)
+    # 从配置中读取颜色（同一配置版本下所有标记共用一份）
+    rect_color_hex, name_color_hex, temp_color_hex, rectWidth, name_font_size, temp_font_size = _mark_style(imageIndex)
 
-    # 两个canvas统一使用热力图的字体大小配置，确保文字大小完全一致
-    name_font_size = config.get("heat_name_font_size", 12)
-    temp_font_size = config.get("heat_temp_font_size", 10)
-
-    # 轉換十六進制顏色
-    def hex_to_rgb(hex_color):
-        """回傳 (R, G, B)，供 PIL 繪製文字使用。"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
-    def hex_to_bgr(hex_color):
-        """回傳 (B, G, R)，供 OpenCV 繪製圖形使用。"""
-        r, g, b = hex_to_rgb(hex_color)
-        return (b, g, r)
-
-    # OpenCV 繪圖用 BGR（矩形框、三角形、描邊）
-    rectColor = hex_to_bgr(rect_color_hex)
-    tempColor = hex_to_bgr(temp_color_hex)
+    # 圖形與文字都直接畫在 BGR 影像上，顏色皆用 BGR
+    rectColor = _hex_to_bgr(rect_color_hex)
+    tempColor = _hex_to_bgr(temp_color_hex)
+    textColor = _hex_to_bgr(name_color_hex)
     shadowColor = (0, 0, 0)
-    # PIL 繪文字用 RGB（元器件名稱、溫度數值）
-    textColor = hex_to_rgb(name_color_hex)
-    tempTextColor = hex_to_rgb(temp_color_hex)
 
     # 获取图像尺寸
     img_height, img_width = imageA.shape[:2]
-    
-    for item in mark_rect_A:
-        # 获取 item 中的坐标和文本信息
-        left, top, right, bottom, cx, cy, max_temp, name = item.get("x1"), item.get("y1"), item.get("x2"), item.get("y2"), item.get("cx"), item.get("cy"), item.get("max_temp"), item.get("name")
-        left = int(left * imageScale)
-        top = int(top * imageScale)
-        right = int(right * imageScale)
-        bottom = int(bottom * imageScale)
-        cx = int(cx * imageScale)
-        cy = int(cy * imageScale)
-
-        # 对于Layout图，使用图像实际尺寸进行边界检查
-        if imageIndex != 0:
-            # 使用图像实际尺寸进行边界检查
-            left = max(0, left)
-            top = max(0, top)
-            right = min(right, img_width)
-            bottom = min(bottom, img_height)
-            cx = max(0, min(cx, img_width - 1))
-            cy = max(0, min(cy, img_height - 1))
+
+    if not mark_rect_A:
+        return imageA
+
+    # 所有标记的坐标一次组成 (N, 6) 数组统一缩放（astype 与 int() 相同，向零截断）
+    if coords is None:
+        coords = mark_coords_array(mark_rect_A)
+    scaled = (np.asarray(coords, dtype=np.float64) * imageScale).astype(np.int64)
+
+    # 对于Layout图，使用图像实际尺寸进行边界检查
+    if imageIndex != 0:
+        np.maximum(scaled[:, 0:2], 0, out=scaled[:, 0:2])                       # left, top >= 0
+        np.minimum(scaled[:, 2], img_width, out=scaled[:, 2])                   # right <= 宽
+        np.minimum(scaled[:, 3], img_height, out=scaled[:, 3])                  # bottom <= 高
+        np.clip(scaled[:, 4], 0, img_width - 1, out=scaled[:, 4])               # cx
+        np.clip(scaled[:, 5], 0, img_height - 1, out=scaled[:, 5])              # cy
+
+    # 与标记无关、整张图共用的尺寸（只计算一次，不在循环内重复乘法与取整）
+    dot_r = max(3, int(4 * textScale))   # 圆点半径
+    half = size // 2                      # 三角形半边长
+    tri_half = size / 2                   # 温度文字相对三角形的偏移基准
+    gap = int(7 * textScale)              # 温度文字与三角形的间距
+    line_type = _frame_line_type(rectWidth, textScale)  # 框线线型
+
+    # 第一遍：以 OpenCV 绘制所有框线与三角形，并收集文字绘制所需的参数
+    frame_polys = []  # 矩形/旋转矩形框线，循环结束后以一次 polylines 绘制
+    triangles = []    # 温度三角形顶点，在框线之后绘制
+    text_jobs = []
+    rect_pts, tri_ok = _compute_geometry(scaled, half, img_width, img_height, imageIndex != 0)
+    for i, (item, (left, top, right, bottom, cx, cy), in_bounds) in enumerate(
+            zip(mark_rect_A, scaled.tolist(), tri_ok.tolist())):
+        # 获取 item 中的文本信息
+        max_temp, name = item.get("max_temp"), item.get("name")
 
         # 繪製框（支援圓形、圓點和旋轉）
         shape = item.get("shape", "rectangle")
         angle = item.get("angle", 0)
         if shape == "dot":
-            dot_r = max(3, int(4 * textScale))
             cv2.circle(imageA, (cx, cy), dot_r, rectColor, -1, cv2.LINE_AA)
         elif shape == "circle":
             center_x = int((left + right) / 2)
             center_y = int((top + bottom) / 2)
             axis_x = int((right - left) / 2)
             axis_y = int((bottom - top) / 2)
-            cv2.ellipse(imageA, (center_x, center_y), (axis_x, axis_y), 0, 0, 360, rectColor, rectWidth, cv2.LINE_AA)
+            cv2.ellipse(imageA, (center_x, center_y), (axis_x, axis_y), 0, 0, 360, rectColor, rectWidth, line_type)
         elif angle != 0:
             geo_cx_draw = (left + right) / 2
             geo_cy_draw = (top + bottom) / 2
             half_w_draw = (right - left) / 2
             half_h_draw = (bottom - top) / 2
             rot_corners = get_rotated_corners(geo_cx_draw, geo_cy_draw, half_w_draw, half_h_draw, angle)
-            rot_pts = np.array(rot_corners, np.int32).reshape((-1, 1, 2))
-            cv2.polylines(imageA, [rot_pts], isClosed=True, color=rectColor, thickness=rectWidth, lineType=cv2.LINE_AA)
+            frame_polys.append(np.array(rot_corners, np.int32).reshape((-1, 1, 2)))
         else:
-            cv2.rectangle(imageA, (left, top), (right, bottom), rectColor, rectWidth, cv2.LINE_AA)
-
-        # 计算三角形的三个顶点
-        center = (cx, cy)
-        point1 = (center[0], center[1] - size // 2)
-        point2 = (center[0] - size // 2, center[1] + size // 2)
-        point3 = (center[0] + size // 2, center[1] + size // 2)
+            frame_polys.append(rect_pts[i])
 
-        # 对于Layout图，检查三角形是否在边界内
-        if imageIndex != 0:
-            # 检查三角形顶点是否在边界内
-            triangle_in_bounds = (
-                0 <= point1[0] < img_width and 0 <= point1[1] < img_height and
-                0 <= point2[0] < img_width and 0 <= point2[1] < img_height and
-                0 <= point3[0] < img_width and 0 <= point3[1] < img_height
-            )
-            
-            if not triangle_in_bounds:
-                print(f"警告：三角形 {name} 超出Layout图边界，跳过绘制")
-                # 跳过三角形绘制，但继续绘制文本
-            else:
-                # 将顶点连接成一个三角形
-                pts = np.array([point1, point2, point3], np.int32)
-                pts = pts.reshape((-1, 1, 2))
-                # 三角形 4 方向描邊
-                for odx, ody in OUTLINE_OFFSETS:
-                    outline_pts = np.array([
-                        (point1[0] + odx, point1[1] + ody),
-                        (point2[0] + odx, point2[1] + ody),
-                        (point3[0] + odx, point3[1] + ody)
-                    ], np.int32).reshape((-1, 1, 2))
-                    cv2.fillPoly(imageA, [outline_pts], color=shadowColor)
-                # 绘制三角形
-                cv2.fillPoly(imageA, [pts], color=tempColor)
+        # 对于Layout图，三角形超出边界时（已于 _compute_geometry 一次判断）
+        if not in_bounds:
+            print(f"警告：三角形 {name} 超出Layout图边界，跳过绘制")
+            # 跳过三角形绘制，但继续绘制文本
         else:
-            # 热力图直接绘制三角形
-            pts = np.array([point1, point2, point3], np.int32)
-            pts = pts.reshape((-1, 1, 2))
-            # 三角形 4 方向描邊
-            for odx, ody in OUTLINE_OFFSETS:
-                outline_pts = np.array([
-                    (point1[0] + odx, point1[1] + ody),
-                    (point2[0] + odx, point2[1] + ody),
-                    (point3[0] + odx, point3[1] + ody)
-                ], np.int32).reshape((-1, 1, 2))
-                cv2.fillPoly(imageA, [outline_pts], color=shadowColor)
-            cv2.fillPoly(imageA, [pts], color=tempColor)
-
-        # 使用 Pillow 绘制文本
-        pil_image = Image.fromarray(cv2.cvtColor(imageA, cv2.COLOR_BGR2RGB))
-        draw = ImageDraw.Draw(pil_image)
-
-        # 使用配置的字型大小（與 EditorCanvas 一致，直接用原始影像座標）
-        name_font_scale = name_font_size
-        temp_font_scale = temp_font_size
-        
-        # 创建字体对象
-        try:
-            name_font = ImageFont.truetype("font/msyh.ttc", int(name_font_scale))
-            temp_font = ImageFont.truetype("font/msyh.ttc", int(temp_font_scale))
-        except IOError:
-            name_font = ImageFont.load_default()
-            temp_font = ImageFont.load_default()
+            triangles.append((cx, cy))
+
+        # 文字留待所有图形画完后统一绘制
+        text_jobs.append((item, left, top, right, bottom, cx, cy, shape, angle, max_temp, name))
+
+    # 所有矩形框线颜色、粗细相同，一次 polylines 调用画完
+    if frame_polys:
+        cv2.polylines(imageA, frame_polys, isClosed=True, color=rectColor, thickness=rectWidth, lineType=line_type)
+
+    # 三角形 4 方向描邊 + 本体：形状全部相同，套用预先光栅化的遮罩，不再逐一 fillPoly
+    for cx, cy in triangles:
+        _blit_triangle(imageA, cx, cy, int(half), shadowColor, tempColor)
 
+    # 所有图形画完后，全部文字以快取的遮罩直接叠加到 imageA（不需转换成 PIL 图像）
+    # 字体大小（使用配置的字型大小，与 EditorCanvas 一致，直接用原始影像座標）
+    name_size = int(name_font_size)
+    temp_size = int(temp_font_size)
+
+    for item, left, top, right, bottom, cx, cy, shape, angle, max_temp, name in text_jobs:
         # 根據方向計算溫度文字偏移（PIL 使用左上角錨點）
         direction = item.get("temp_text_dir", "T")
-        temp_text_str = str(max_temp)
-        temp_bbox = draw.textbbox((0, 0), temp_text_str, font=temp_font)
+        temp_masks = _text_masks(str(max_temp), temp_size)
+        temp_bbox = temp_masks[0]
         tw = temp_bbox[2] - temp_bbox[0]
         th = temp_bbox[3] - temp_bbox[1]
-        tri_half = size / 2
-        gap = int(7 * textScale)
         dx, dy = calc_temp_text_offset(direction, tri_half, tw, th, gap=gap)
         # 從中心偏移轉換為 PIL 左上角座標
         temp_text_x = int(cx + dx - tw / 2)
@@ -779,7 +976,8 @@ def draw_numpy_image_item(imageA, mark_rect_A, imageScale=1, imageIndex=0, size=
         name_ax, name_ay, name_anchor_str = calc_name_text_position(
             name_text_dir, left, top, right, bottom, angle, shape, textScale
         )
-        name_bbox = draw.textbbox((0, 0), name, font=name_font)
+        name_masks = _text_masks(name, name_size)
+        name_bbox = name_masks[0]
         name_tw = name_bbox[2] - name_bbox[0]
         name_th = name_bbox[3] - name_bbox[1]
         name_text_x, name_text_y = _anchor_to_topleft(name_ax, name_ay, name_tw, name_th, name_anchor_str)
@@ -789,37 +987,22 @@ def draw_numpy_image_item(imageA, mark_rect_A, imageScale=1, imageIndex=0, size=
 
             # 检查温度文本是否在边界内
             if 0 <= temp_text_x < img_width and 0 <= temp_text_y < img_height:
-                # 溫度文字 4 方向描邊
-                for odx, ody in OUTLINE_OFFSETS:
-                    draw.text((temp_text_x + odx, temp_text_y + ody), temp_text_str, font=temp_font, fill=shadowColor)
-                draw.text((temp_text_x, temp_text_y), temp_text_str, font=temp_font, fill=tempTextColor)
+                # 溫度文字 4 方向描邊 + 本体
+                _blit_text(imageA, temp_text_x, temp_text_y, temp_masks, shadowColor, tempColor)
             else:
                 print(f"警告：温度文本 {name} 超出Layout图边界，跳过绘制")
 
             # 检查名称文本是否在边界内
             if 0 <= name_text_x < img_width and 0 <= name_text_y < img_height:
-                # 名稱文字 4 方向描邊
-                for odx, ody in OUTLINE_OFFSETS:
-                    draw.text((name_text_x + odx, name_text_y + ody), name, font=name_font, fill=shadowColor)
-                draw.text((name_text_x, name_text_y), name, font=name_font, fill=textColor)
+                # 名稱文字 4 方向描邊 + 本体
+                _blit_text(imageA, name_text_x, name_text_y, name_masks, shadowColor, textColor)
             else:
                 print(f"警告：名称文本 {name} 超出Layout图边界，跳过绘制")
         else:
-            # 热力图直接绘制文本 — 溫度文字 4 方向描邊
-            for odx, ody in OUTLINE_OFFSETS:
-                draw.text((temp_text_x + odx, temp_text_y + ody), temp_text_str, font=temp_font, fill=shadowColor)
-            draw.text((temp_text_x, temp_text_y), temp_text_str, font=temp_font, fill=tempTextColor)
-            # 名稱文字 4 方向描邊
-            for odx, ody in OUTLINE_OFFSETS:
-                draw.text((name_text_x + odx, name_text_y + ody), name, font=name_font, fill=shadowColor)
-            draw.text((name_text_x, name_text_y), name, font=name_font, fill=textColor)
-
-        # pil_image.show()  # 直接显示 PIL 图像
-
-        # 将 PIL 图像转换回 OpenCV 图像
-        imageA = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+            # 热力图直接绘制文本（4 方向描邊 + 本体）
+            _blit_text(imageA, temp_text_x, temp_text_y, temp_masks, shadowColor, tempColor)
+            _blit_text(imageA, name_text_x, name_text_y, name_masks, shadowColor, textColor)
 
-        # print(f"Text position: ({cx - int(16 * textScale)}, {cy - int(10 * textScale)})")
     return imageA
 
 # 调用示例：
@@ -32,6 +32,7 @@ UI 元件對應命名：
 """
 
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import ttk
 from PIL import Image, ImageTk, ImageGrab
 from placeholder_entry import PlaceholderEntry
@@ -52,6 +53,11 @@ try:
 except ImportError:
     from tooltip import Tooltip
 
+# 背景圖縮放結果快取的容量（視窗在幾個尺寸間來回調整時可直接重用）
+_BG_CACHE_SIZE = 8
+# 視窗調整大小時，背景圖重新縮放的延遲（ms），連續的 <Configure> 事件只處理最後一次
+_BG_RESIZE_DELAY_MS = 30
+
 
 class EditorCanvas:
     """溫度編輯畫布對話框。
@@ -95,6 +101,8 @@ class EditorCanvas:
         self.last_window_width = 0
           # 控制更新的频率
         self.resize_after = None
+        # 背景图缩放快取：(宽, 高) → ImageTk.PhotoImage，最久未使用的先淘汰
+        self._bg_cache = OrderedDict()
 
         # 加载背景图片（使用 Pillow）
         self.bg_image = image #Image.open(image_path)  # 通过参数传入图片路径
@@ -186,7 +194,7 @@ class EditorCanvas:
         self.canvas.grid(row=0, column=0, sticky="")
 
         # 绑定框架大小变化事件，调用update_bg_image进行缩放
-        canvas_frame.bind('<Configure>', lambda e: self.update_bg_image() if hasattr(self, 'canvas') and self.canvas is not None else None)
+        canvas_frame.bind('<Configure>', lambda e: self._schedule_update_bg_image())
 
         # 延迟执行一次调整，确保框架已初始化
         self.dialog.after(200, self.update_bg_image)
@@ -1719,8 +1727,33 @@ class EditorCanvas:
     def on_resize(self, event):
         # 每当窗口大小发生变化时，调整背景图片和Canvas的尺寸
         # 只有在canvas已经创建后才调用update_bg_image
-        if hasattr(self, 'canvas') and self.canvas is not None:
-            self.update_bg_image()
+        self._schedule_update_bg_image()
+
+    def _schedule_update_bg_image(self):
+        """延遲執行 update_bg_image；拖曳調整視窗時連續觸發的事件只保留最後一次。"""
+        if not hasattr(self, 'canvas') or self.canvas is None:
+            return
+        if self.resize_after:
+            self.dialog.after_cancel(self.resize_after)
+        self.resize_after = self.dialog.after(_BG_RESIZE_DELAY_MS, self._run_update_bg_image)
+
+    def _run_update_bg_image(self):
+        """延遲計時到期時執行背景圖更新。"""
+        self.resize_after = None
+        self.update_bg_image()
+
+    def _get_scaled_bg_image(self, width, height):
+        """取得縮放至 (width, height) 的背景 PhotoImage，已縮放過的尺寸直接從快取取用。"""
+        key = (width, height)
+        photo = self._bg_cache.get(key)
+        if photo is not None:
+            self._bg_cache.move_to_end(key)
+            return photo
+        photo = ImageTk.PhotoImage(self.bg_image.resize(key, Image.LANCZOS))
+        self._bg_cache[key] = photo
+        if len(self._bg_cache) > _BG_CACHE_SIZE:
+            self._bg_cache.popitem(last=False)
+        return photo
 
     def update_bg_image(self):
         # 检查dialog和canvas属性是否存在
@@ -1755,11 +1788,8 @@ class EditorCanvas:
         new_width = int(self.original_width * scale_ratio)
         new_height = int(self.original_height * scale_ratio)
 
-        # 重新缩放背景图像
-        resized_image = self.bg_image.resize((new_width, new_height), Image.LANCZOS)
-
-        # 这里保持对图像的引用
-        _bg_image = ImageTk.PhotoImage(resized_image)
+        # 重新缩放背景图像（同一尺寸只缩放一次），并保持对图像的引用
+        _bg_image = self._get_scaled_bg_image(new_width, new_height)
         self.tk_bg_image = _bg_image
 
         # 更新 Canvas 的大小，使其与图像大小匹配
@@ -4647,8 +4677,12 @@ class EditorCanvas:
             if self.on_close_callback:
                 self.on_close_callback([], 0, 0, set())
         
-        # 安全地销毁对话框
+        # 安全地销毁对话框（先取消尚未执行的背景图更新，并释放缩放快取）
         if hasattr(self, 'dialog') and self.dialog is not None:
+            if self.resize_after:
+                self.dialog.after_cancel(self.resize_after)
+                self.resize_after = None
+            self._bg_cache.clear()
             self.dialog.destroy()
 
 
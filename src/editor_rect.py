@@ -65,6 +65,9 @@ class RectEditor:
         selected_rect_ids (set): 選中的矩形框 ID 集合
     """
 
+    # 滾輪縮放/右鍵平移時的重繪間隔（毫秒），約 60 FPS
+    ZOOM_REDRAW_INTERVAL_MS = 16
+
     def __init__(self, parent, canvas, mark_rect = None, temp_file_path = None, on_rect_change_callback=None):
         """初始化矩形框編輯器。
 
@@ -83,6 +86,7 @@ class RectEditor:
         self.on_rect_change_callback = on_rect_change_callback  # 矩形框变化回调
         self.display_scale = 1.0  # 当前显示缩放比例
         self._base_font_scale = 1.0  # 放大模式下的基礎字體縮放比例（由 on_zoom_change 設定）
+        self._zoom_redraw_after = None  # 滾輪縮放/拖動平移時尚未執行的重繪任務 ID
         self.drag_threshold = 3  # 拖拽阈值，小于此值不触发拖拽
         # Create canvas if not passed as argument
         # if canvas:
@@ -437,8 +441,6 @@ class RectEditor:
             # 更新保存的字體縮放比例
             rect["_font_scale"] = self.display_scale
 
-        print(f"✓ 已缩放所有矩形框，显示比例: {self.display_scale:.3f}")
-
     # 画三角形
     def draw_triangle(self, a_x, a_y):
         size = 6
@@ -2232,10 +2234,34 @@ class RectEditor:
         self.zoom_scale = self.min_zoom
         self.canvas_offset_x = 0
         self.canvas_offset_y = 0
-        # 通知重新繪製
+        # 通知重新繪製（取消尚未執行的節流重繪，改為立即重繪）
+        self._cancel_zoom_redraw()
         if hasattr(self, 'on_zoom_change_callback') and self.on_zoom_change_callback:
             self.on_zoom_change_callback()
 
+    def _schedule_zoom_redraw(self):
+        """節流縮放/平移後的重繪：同一時間最多排程一次，約每 ZOOM_REDRAW_INTERVAL_MS 毫秒重繪一次。
+
+        滾輪與右鍵拖動事件的頻率遠高於畫面更新率，每個事件都整個重繪（背景縮放 + 所有標記）
+        會造成卡頓；已有待執行的重繪時直接略過，執行時會採用當下最新的縮放與偏移量。
+        """
+        if not (hasattr(self, 'on_zoom_change_callback') and self.on_zoom_change_callback):
+            return
+        if self._zoom_redraw_after is None:
+            self._zoom_redraw_after = self.canvas.after(self.ZOOM_REDRAW_INTERVAL_MS, self._run_zoom_redraw)
+
+    def _run_zoom_redraw(self):
+        """執行排程中的縮放/平移重繪。"""
+        self._zoom_redraw_after = None
+        if self.on_zoom_change_callback:
+            self.on_zoom_change_callback()
+
+    def _cancel_zoom_redraw(self):
+        """取消尚未執行的縮放/平移重繪。"""
+        if self._zoom_redraw_after is not None:
+            self.canvas.after_cancel(self._zoom_redraw_after)
+            self._zoom_redraw_after = None
+
     def on_mouse_wheel(self, event):
         """處理滾輪縮放（Windows/macOS）"""
         if not self.magnifier_mode_enabled:
@@ -2288,9 +2314,8 @@ class RectEditor:
             self.canvas_offset_x = mouse_x - img_x * self.zoom_scale
             self.canvas_offset_y = mouse_y - img_y * self.zoom_scale
 
-        # 通知重新繪製
-        if hasattr(self, 'on_zoom_change_callback') and self.on_zoom_change_callback:
-            self.on_zoom_change_callback()
+        # 通知重新繪製（節流，連續滾動時合併為一次）
+        self._schedule_zoom_redraw()
 
     def on_right_click_start(self, event):
         """開始右鍵拖動"""
@@ -2323,9 +2348,8 @@ class RectEditor:
         self.pan_start_x = event.x
         self.pan_start_y = event.y
 
-        # 通知重新繪製
-        if hasattr(self, 'on_zoom_change_callback') and self.on_zoom_change_callback:
-            self.on_zoom_change_callback()
+        # 通知重新繪製（節流，連續拖動時合併為一次）
+        self._schedule_zoom_redraw()
 
     def on_right_click_end(self, event):
         """結束右鍵拖動"""
@@ -227,6 +227,7 @@ class ResizableImagesApp:
 
         # 對話框實例（單例模式，避免重複開啟）
         self.setting_dialog = None  # 設定對話框實例 (SettingDialog)
+        self.template_dialog = None  # 溫度過濾對話框實例 (TemplateDialog)
         self.editor_canvas = None   # 溫度標記編輯畫布實例 (EditorCanvas)
 
         # self.save_log_file()
@@ -2603,8 +2604,13 @@ class ResizableImagesApp:
         print("点击温度过滤按钮，开始创建对话框...")
         try:
             print(f"当前文件夹路径: {self.current_folder_path}")
-            templateDialog = TemplateDialog(self.root, self.template_filter_button, self.on_template_confirm, self.current_folder_path)
-            print("TemplateDialog创建成功，准备打开对话框...")
+            # 使用单例模式，重用同一个TemplateDialog（对话框关闭时只隐藏，不销毁元件）
+            if self.template_dialog is None:
+                self.template_dialog = TemplateDialog(self.root, self.template_filter_button, self.on_template_confirm, self.current_folder_path)
+                print("TemplateDialog创建成功，准备打开对话框...")
+            else:
+                self.template_dialog.set_folder_path(self.current_folder_path)
+            templateDialog = self.template_dialog
             
             # 在打开对话框前，同步文件信息到温度配置管理器
             print("同步文件信息到温度配置管理器...")